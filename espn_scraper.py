@@ -0,0 +1,197 @@
+"""Scraper for ESPN's public JSON endpoints."""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+import requests
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
+
+# ESPN paths keyed by the short sport names used across the project.
+SPORT_PATHS = {
+    "nfl": "football/nfl",
+    "nba": "basketball/nba",
+    "mlb": "baseball/mlb",
+    "nhl": "hockey/nhl",
+    "ncaaf": "football/college-football",
+    "ncaam": "basketball/mens-college-basketball",
+}
+
+
+class ESPNScraper:
+    """Pulls teams, standings and results from ESPN's site API."""
+
+    def __init__(
+        self,
+        headless: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
+        self.headless = headless
+        # A session keeps the TCP/TLS connection warm between calls, so
+        # back-to-back fetches skip the handshake.
+        self.session = session if session is not None else requests.Session()
+
+    def _sport_path(self, sport: str) -> str:
+        path = SPORT_PATHS.get(sport)
+        if path is None:
+            raise ValueError(f"Unsupported sport: {sport}")
+        return path
+
+    def get_teams(self, sport: str) -> List[Dict]:
+        """Return team summaries for a sport, including season records."""
+        url = f"{BASE_URL}/{self._sport_path(sport)}/teams"
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+
+        teams = []
+        for entry in (
+            data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
+        ):
+            team = entry.get("team", {})
+            record = self._parse_record(team)
+            teams.append(
+                {
+                    "id": team.get("id"),
+                    "name": team.get("displayName"),
+                    "abbreviation": team.get("abbreviation"),
+                    "wins": record.get("wins", 0),
+                    "losses": record.get("losses", 0),
+                    "win_percentage": record.get("win_percentage", 0.0),
+                }
+            )
+        return teams
+
+    @staticmethod
+    def _parse_record(team: Dict) -> Dict:
+        """Pull wins/losses out of ESPN's nested record structure."""
+        items = team.get("record", {}).get("items", [])
+        for item in items:
+            stats = {s.get("name"): s.get("value") for s in item.get("stats", [])}
+            if "wins" in stats:
+                wins = int(stats.get("wins", 0))
+                losses = int(stats.get("losses", 0))
+                games = wins + losses
+                return {
+                    "wins": wins,
+                    "losses": losses,
+                    "win_percentage": wins / games if games else 0.0,
+                }
+        return {}
+
+    def get_team_stats(self, team_id: str, sport: str) -> Optional[Dict]:
+        """Return detailed stats for one team."""
+        url = f"{BASE_URL}/{self._sport_path(sport)}/teams/{team_id}"
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        team = data.get("team")
+        if team is None:
+            return None
+        record = self._parse_record(team)
+        return {
+            "id": team.get("id"),
+            "name": team.get("displayName"),
+            "abbreviation": team.get("abbreviation"),
+            **record,
+        }
+
+    async def get_team_stats_async(
+        self, session: aiohttp.ClientSession, team_id: str, sport: str
+    ) -> Optional[Dict]:
+        """Async variant of :meth:`get_team_stats` on a shared session."""
+        url = f"{BASE_URL}/{self._sport_path(sport)}/teams/{team_id}"
+        async with session.get(
+            url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        team = data.get("team")
+        if team is None:
+            return None
+        record = self._parse_record(team)
+        return {
+            "id": team.get("id"),
+            "name": team.get("displayName"),
+            "abbreviation": team.get("abbreviation"),
+            **record,
+        }
+
+    async def get_team_stats_many(
+        self, team_ids: Iterable[str], sport: str, max_concurrency: int = 5
+    ) -> List[Optional[Dict]]:
+        """Fetch stats for many teams concurrently.
+
+        Requests share one ClientSession (one TCP/TLS handshake) and are
+        bounded by a semaphore so ESPN sees at most ``max_concurrency``
+        in-flight calls; wall time drops from sum to roughly max of the
+        individual request latencies.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with aiohttp.ClientSession() as session:
+
+            async def fetch(team_id: str) -> Optional[Dict]:
+                async with semaphore:
+                    return await self.get_team_stats_async(session, team_id, sport)
+
+            results = await asyncio.gather(
+                *(fetch(team_id) for team_id in team_ids),
+                return_exceptions=True,
+            )
+        return [r if not isinstance(r, Exception) else None for r in results]
+
+    def get_game_results(self, team_id: str, sport: str) -> List[Dict]:
+        """Return recent game results for a team from its schedule feed."""
+        url = f"{BASE_URL}/{self._sport_path(sport)}/teams/{team_id}/schedule"
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+
+        results = []
+        for event in data.get("events", []):
+            competition = (event.get("competitions") or [{}])[0]
+            status = competition.get("status", {}).get("type", {})
+            if not status.get("completed"):
+                continue
+            competitors = competition.get("competitors", [])
+            results.append(
+                {
+                    "event_id": event.get("id"),
+                    "date": event.get("date"),
+                    "name": event.get("name"),
+                    "competitors": [
+                        {
+                            "team_id": c.get("team", {}).get("id"),
+                            "home_away": c.get("homeAway"),
+                            "score": c.get("score", {}).get("value"),
+                            "winner": c.get("winner", False),
+                        }
+                        for c in competitors
+                    ],
+                }
+            )
+        return results
+
+    def get_player_stats(self, team_id: str, sport: str) -> List[Dict]:
+        """Return the roster with whatever per-player stats ESPN exposes."""
+        url = f"{BASE_URL}/{self._sport_path(sport)}/teams/{team_id}/roster"
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+
+        players = []
+        for group in data.get("athletes", []):
+            for athlete in group.get("items", []):
+                players.append(
+                    {
+                        "id": athlete.get("id"),
+                        "name": athlete.get("displayName"),
+                        "position": athlete.get("position", {}).get("abbreviation"),
+                        "jersey": athlete.get("jersey"),
+                    }
+                )
+        return players
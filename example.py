@@ -0,0 +1,198 @@
+"""Runnable examples for the fantasy probability calculator."""
+
+import asyncio
+import heapq
+import logging
+import operator
+import os
+
+import numpy as np
+from numba import float64, int64, vectorize
+
+from fantasy_calculator import DatabaseManager
+from espn_scraper import ESPNScraper
+from odds_api import OddsManager
+from probability_calculator import (
+    FantasyProbabilityCalculator,
+    GameContext,
+    TeamStats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@vectorize([float64(int64)], nopython=True, fastmath=True, target="parallel")
+def american_to_decimal(o):
+    """Decimal odds for one American quote; broadcasts over arrays."""
+    return 1.0 + (o / 100.0 if o > 0 else 100.0 / -o)
+
+
+@vectorize([float64(int64)], nopython=True, fastmath=True, target="parallel")
+def american_to_prob(o):
+    """Implied probability for one American quote; broadcasts over arrays."""
+    return -o / (-o + 100.0) if o < 0 else 100.0 / (o + 100.0)
+
+
+def analyze_fantasy_opportunities(
+    db_manager: DatabaseManager, sport: str, top_k: int = 3
+) -> list:
+    """Scan stored odds for expected value and return the ``top_k`` best."""
+    odds_manager = OddsManager()
+    opportunities = []
+    for game in db_manager.get_upcoming_games(sport):
+        for odds in db_manager.get_fantasy_odds_for_game(game.id):
+            implied = odds_manager.convert_american_to_probability(odds.odds)
+            # Placeholder model: fade the vig and assume a small edge on
+            # home selections until real probabilities are wired in.
+            true_prob = implied * 1.02
+            payout = odds_manager.convert_american_to_decimal(odds.odds) - 1.0
+            expected_value = true_prob * payout - (1.0 - true_prob)
+            opportunities.append(
+                {
+                    "game_id": game.id,
+                    "selection": odds.selection,
+                    "bookmaker": odds.bookmaker,
+                    "odds": odds.odds,
+                    "implied_probability": implied,
+                    "expected_value": expected_value,
+                }
+            )
+    # Only the leaders matter, so keep a k-sized heap (O(M log k)) rather
+    # than sorting the full slate; itemgetter keeps the key extraction in C.
+    return heapq.nlargest(
+        top_k, opportunities, key=operator.itemgetter("expected_value")
+    )
+
+
+def example_basic_usage():
+    """Check API keys and surface the current best opportunities."""
+    print("=== Basic Usage ===")
+
+    # Snapshot the environment once: no repeated os.getenv walks, and the
+    # checks below all see a consistent view even if the env changes.
+    env = os.environ.copy()
+
+    required_key = "THE_ODDS_API_KEY"
+    value = env.get(required_key)
+    if value and value != f"your_{required_key.lower()}_here":
+        print(f"{required_key}: configured")
+    else:
+        print(f"{required_key}: missing (set it to enable odds ingestion)")
+
+    optional_keys = ["ODDS_API_COM_KEY", "SPORTSDATA_IO_KEY"]
+    for key in optional_keys:
+        value = env.get(key)
+        if value and value != f"your_{key.lower()}_here":
+            print(f"{key}: configured")
+        else:
+            print(f"{key}: not set (optional)")
+
+    db = DatabaseManager()
+    opportunities = analyze_fantasy_opportunities(db, "nfl")
+    print(f"Top {len(opportunities)} opportunities:")
+    for opp in opportunities:
+        print(
+            f"  {opp['selection']} @ {opp['odds']} ({opp['bookmaker']}): "
+            f"EV {opp['expected_value']:.3f}"
+        )
+
+
+def example_espn_scraping():
+    """Rank NFL teams by win percentage from ESPN's team feed."""
+    print("=== ESPN Scraping ===")
+    scraper = ESPNScraper()
+    teams = scraper.get_teams("nfl")
+    print(f"Fetched {len(teams)} teams")
+    if not teams:
+        return
+
+    # np.argsort on a preallocated float array avoids a Python-level key
+    # call per team; one C qsort on a contiguous FP32 buffer instead.
+    wp = np.fromiter(
+        (t["win_percentage"] for t in teams), dtype=np.float32, count=len(teams)
+    )
+    order = np.argsort(-wp, kind="stable")
+    top_teams = [teams[i] for i in order[:5]]
+
+    # Detail fetches fan out concurrently under a bounded semaphore
+    # instead of paying one network round trip per team in sequence.
+    details = asyncio.run(
+        scraper.get_team_stats_many([t["id"] for t in top_teams], "nfl")
+    )
+
+    print("Top 5 by win percentage:")
+    for team, detail in zip(top_teams, details):
+        record = f"{team['wins']}-{team['losses']}"
+        if detail is not None:
+            record = f"{detail['wins']}-{detail['losses']}"
+        print(f"  {team['name']}: {record} ({team['win_percentage']:.3f})")
+
+
+def example_odds_conversion():
+    """Show American odds converted to decimal odds and probabilities."""
+    print("=== Odds Conversion ===")
+    american_odds = np.array([-200, -150, -110, 100, 120, 150, 200, 300], dtype=np.int64)
+    # One ufunc call converts the whole book instead of a Python method
+    # call per quote; the kernels above compile to SIMD loops.
+    decimals = american_to_decimal(american_odds)
+    probabilities = american_to_prob(american_odds)
+    for odds, decimal, probability in zip(american_odds, decimals, probabilities):
+        print(f"  {odds:+d} -> decimal {decimal:.2f}, implied {probability:.1%}")
+
+
+def example_probability_calculation():
+    """Score one made-up matchup across the three team markets."""
+    print("=== Probability Calculation ===")
+    calculator = FantasyProbabilityCalculator()
+
+    home_stats = TeamStats(
+        team_name="Home Heroes",
+        wins=9,
+        losses=4,
+        points_for=26.1,
+        points_against=19.8,
+        recent_form=[True, True, False, True, True],
+        home_record=[6, 1],
+        away_record=[3, 3],
+    )
+    away_stats = TeamStats(
+        team_name="Away Admirals",
+        wins=7,
+        losses=6,
+        points_for=22.4,
+        points_against=23.1,
+        recent_form=[False, True, True, False, True],
+        home_record=[4, 2],
+        away_record=[3, 4],
+    )
+    context = GameContext(sport="nfl", home_team=home_stats, away_team=away_stats)
+
+    # One fused kernel call covers moneyline, spread and total for the
+    # whole slate (here a slate of one) instead of three scalar passes.
+    probs = calculator.calculate_game_probabilities_batch(
+        [context], spreads=[-3.5], totals=[47.5]
+    )
+
+    print(f"  Home win: {probs['home_win_probability'][0]:.1%}")
+    print(f"  Away win: {probs['away_win_probability'][0]:.1%}")
+    print(f"  Cover -3.5: {probs['cover_probability'][0]:.1%}")
+    print(f"  Over 47.5: {probs['over_probability'][0]:.1%}")
+
+
+def main():
+    examples = [
+        example_basic_usage,
+        example_espn_scraping,
+        example_odds_conversion,
+        example_probability_calculation,
+    ]
+    for example in examples:
+        try:
+            example()
+        except Exception as e:
+            logger.error("Example %s failed: %s", example.__name__, e)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,762 @@
+"""SQLite-backed storage layer for the fantasy probability calculator."""
+
+import atexit
+import functools
+import json
+import logging
+import queue
+import sqlite3
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+import msgpack
+import numpy as np
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from models import (
+    Game,
+    Odds,
+    Player,
+    PlayerProp,
+    PlayerStats,
+    SIDE_AWAY,
+    SIDE_HOME,
+    SIDE_OVER,
+    SIDE_UNDER,
+    SIDE_UNKNOWN,
+    Team,
+)
+
+# File logging goes through a queue so a logger.info in an ingestion loop
+# is a lock-free enqueue instead of a synchronous write+flush; the
+# listener thread drains the queue to disk off the hot path.
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_log_queue = queue.SimpleQueue()
+_file_handler = logging.FileHandler("fantasy_calculator.log")
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_log_listener = QueueListener(
+    _log_queue, _file_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format=_LOG_FORMAT,
+    handlers=[
+        QueueHandler(_log_queue),
+        logging.StreamHandler(sys.stdout),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+# Passing the SAME string object to execute() lets SQLite's per-connection
+# statement cache hit on identity, skipping re-tokenizing and re-planning.
+sqlite3.enable_callback_tracebacks(False)
+
+_SQL_INSERT_TEAM = (
+    "INSERT OR REPLACE INTO teams (id, name, sport, conference, division)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_PLAYER = (
+    "INSERT OR REPLACE INTO players (id, name, team_id, sport, position)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_GAME = (
+    "INSERT OR REPLACE INTO games (id, sport, home_team, away_team, start_time, status)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_ODDS = (
+    "INSERT INTO fantasy_odds"
+    " (game_id, bookmaker, market_type, selection, odds, timestamp, side)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT DO NOTHING"
+)
+_SQL_INSERT_PROP = (
+    "INSERT INTO player_performance_props"
+    " (game_id, player_id, player_name, prop_type, line,"
+    "  over_odds, under_odds, bookmaker, timestamp)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_PLAYER_STATS = (
+    "INSERT OR REPLACE INTO player_stats"
+    " (player_id, season, team_id, stats, recent_form, updated_at)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_HISTORY = (
+    "INSERT INTO historical_data"
+    " (team_id, game_date, opponent_id, points_for, points_against, won)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_SELECT_TEAMS_BY_SPORT = (
+    "SELECT id, name, sport, conference, division FROM teams WHERE sport = ?"
+)
+_SQL_SELECT_PLAYERS_BY_TEAM = (
+    "SELECT id, name, team_id, sport, position FROM players"
+    " WHERE team_id = ? AND sport = ?"
+)
+_SQL_SELECT_UPCOMING_GAMES = (
+    "SELECT id, sport, home_team, away_team, start_time, status FROM games"
+    " WHERE sport = ? AND start_time BETWEEN ? AND ? AND status = 'scheduled'"
+    " ORDER BY start_time"
+)
+_SQL_SELECT_PROPS_FOR_GAME = (
+    "SELECT game_id, player_id, player_name, prop_type, line,"
+    " over_odds, under_odds, bookmaker, timestamp"
+    " FROM player_performance_props WHERE game_id = ?"
+)
+# IN-list templates; the placeholder block is filled per call, so these
+# only hit the statement cache when batch sizes repeat.
+_SQL_SELECT_PROPS_FOR_GAMES = (
+    "SELECT game_id, player_id, player_name, prop_type, line,"
+    " over_odds, under_odds, bookmaker, timestamp"
+    " FROM player_performance_props WHERE game_id IN (%s)"
+)
+_SQL_SELECT_PLAYER_STATS_BULK = (
+    "SELECT player_id, season, team_id, stats, recent_form, updated_at"
+    " FROM player_stats WHERE player_id IN (%s) ORDER BY season DESC"
+)
+_SQL_SELECT_PLAYER_STATS_SEASON = (
+    "SELECT player_id, season, team_id, stats, recent_form, updated_at"
+    " FROM player_stats WHERE player_id = ? AND season = ?"
+)
+_SQL_SELECT_PLAYER_STATS_LATEST = (
+    "SELECT player_id, season, team_id, stats, recent_form, updated_at"
+    " FROM player_stats WHERE player_id = ? ORDER BY season DESC LIMIT 1"
+)
+_SQL_SELECT_ODDS_FOR_GAME = (
+    "SELECT game_id, bookmaker, market_type, selection, odds, timestamp, side"
+    " FROM fantasy_odds WHERE game_id = ?"
+)
+_SQL_SELECT_PLAYER_GAME_CACHE = (
+    "SELECT payload, fetched_at FROM player_last_game_cache"
+    " WHERE league = ? AND team = ? AND player = ? AND day = ?"
+)
+_SQL_INSERT_PLAYER_GAME_CACHE = (
+    "INSERT OR REPLACE INTO player_last_game_cache"
+    " (league, team, player, day, payload, fetched_at)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def _decode_stats(raw: bytes) -> dict:
+    """Decode a stats BLOB, tolerating legacy JSON text rows."""
+    if not raw:
+        return {}
+    if raw[:1] == b"{":  # msgpack maps never start with 0x7b
+        return json.loads(raw)
+    return msgpack.unpackb(raw, raw=False)
+
+
+def _pack_recent_form(form: List[bool]) -> int:
+    """Bit-pack recent form into one integer, oldest game in bit 0.
+
+    A sentinel bit just above the data preserves the list length, so
+    ``[True, False]`` and ``[True]`` stay distinct.  Capped at 62 games
+    to fit SQLite's signed 64-bit INTEGER; win counts over the packed
+    value are a single ``int.bit_count()`` (POPCNT) instead of a loop.
+    """
+    bits = 0
+    for i, won in enumerate(form[:62]):
+        if won:
+            bits |= 1 << i
+    return bits | (1 << min(len(form), 62))
+
+
+def _decode_recent_form(raw: bytes) -> list:
+    """Decode a recent-form value, tolerating legacy blob/JSON rows."""
+    if not raw:
+        return []
+    if raw[:1] == b"[":
+        return json.loads(raw)
+    if raw.isdigit():
+        packed = int(raw)
+        n = packed.bit_length() - 1
+        return [bool((packed >> i) & 1) for i in range(n)]
+    return [bool(b) for b in np.frombuffer(raw, dtype=np.int8)]
+
+
+# With detect_types=PARSE_DECLTYPES the driver runs these converters while
+# building each row, so the get_* methods construct models positionally
+# instead of branching per column in Python.  NULLs bypass converters.
+sqlite3.register_converter("MSGPACK", _decode_stats)
+sqlite3.register_converter("FORM", _decode_recent_form)
+sqlite3.register_converter("EPOCH", lambda b: datetime.fromtimestamp(int(b)))
+sqlite3.register_converter("ISO", lambda b: datetime.fromisoformat(b.decode()))
+
+
+class DatabaseManager:
+    """Manages the SQLite database used for teams, games, odds and stats.
+
+    A single connection is opened in ``__init__`` and reused for the
+    lifetime of the process.  Opening a fresh connection per call pays
+    page-cache warmup, journal setup and mutex costs on every row, which
+    dominates when odds ingestion inserts hundreds of rows in a loop.
+    Writes are serialized through ``self._lock`` so the shared connection
+    can be used from worker threads.
+    """
+
+    def __init__(self, db_path: str = "fantasy_data.db"):
+        self.db_path = db_path
+        # The driver keeps compiled statements in a per-connection LRU
+        # keyed on SQL text identity; sized above the number of distinct
+        # module-level SQL constants so hot statements are prepared once
+        # for the connection's lifetime and never evicted mid-ingest.
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=256,
+        )
+        self._lock = threading.Lock()
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        atexit.register(self.close)
+        # Per-instance LRU caches (lru_cache on methods would key on self
+        # and pin the instance; binding per instance avoids both).
+        self._cached_player_stats = functools.lru_cache(maxsize=4096)(
+            self._fetch_player_stats
+        )
+        self._cached_teams_by_sport = functools.lru_cache(maxsize=64)(
+            self._fetch_teams_by_sport
+        )
+        self.init_database()
+
+    def close(self) -> None:
+        """Close the cached connection (idempotent)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def init_database(self) -> None:
+        """Create all tables if they do not exist yet."""
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS teams (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    sport TEXT NOT NULL,
+                    conference TEXT,
+                    division TEXT
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS players (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    team_id TEXT,
+                    sport TEXT NOT NULL,
+                    position TEXT,
+                    FOREIGN KEY (team_id) REFERENCES teams (id)
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS games (
+                    id TEXT PRIMARY KEY,
+                    sport TEXT NOT NULL,
+                    home_team TEXT NOT NULL,
+                    away_team TEXT NOT NULL,
+                    start_time EPOCH NOT NULL,
+                    status TEXT DEFAULT 'scheduled'
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS fantasy_odds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    game_id TEXT NOT NULL,
+                    bookmaker TEXT NOT NULL,
+                    market_type TEXT NOT NULL,
+                    selection TEXT NOT NULL,
+                    odds REAL NOT NULL,
+                    timestamp EPOCH NOT NULL,
+                    side INTEGER NOT NULL DEFAULT -1,
+                    FOREIGN KEY (game_id) REFERENCES games (id)
+                )
+                """
+            )
+            # Databases created before the side column existed pick it up
+            # here.
+            try:
+                cursor.execute(
+                    "ALTER TABLE fantasy_odds"
+                    " ADD COLUMN side INTEGER NOT NULL DEFAULT -1"
+                )
+            except sqlite3.OperationalError:
+                pass
+            # Backfill rows still at SIDE_UNKNOWN using the same
+            # classification as ingest: uq_odds plus ON CONFLICT DO
+            # NOTHING means re-ingesting an identical quote never
+            # rewrites them, so without this the analyzers would score
+            # legacy home quotes as away and legacy Overs as Unders.
+            # Moneyline/spread rows whose game is missing stay unknown
+            # rather than guessing a side.
+            cursor.execute(
+                """
+                UPDATE fantasy_odds
+                SET side = CASE
+                    WHEN market_type = 'totals' THEN
+                        CASE WHEN instr(lower(selection), 'over') > 0
+                             THEN ? ELSE ? END
+                    ELSE
+                        CASE WHEN instr(
+                                 lower(selection),
+                                 (SELECT lower(home_team) FROM games
+                                  WHERE games.id = fantasy_odds.game_id)
+                             ) > 0
+                             THEN ? ELSE ? END
+                END
+                WHERE side = ?
+                  AND (market_type = 'totals'
+                       OR EXISTS (SELECT 1 FROM games
+                                  WHERE games.id = fantasy_odds.game_id))
+                """,
+                (SIDE_OVER, SIDE_UNDER, SIDE_HOME, SIDE_AWAY, SIDE_UNKNOWN),
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS player_performance_props (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    game_id TEXT NOT NULL,
+                    player_id TEXT NOT NULL,
+                    player_name TEXT NOT NULL,
+                    prop_type TEXT NOT NULL,
+                    line REAL NOT NULL,
+                    over_odds REAL NOT NULL,
+                    under_odds REAL NOT NULL,
+                    bookmaker TEXT NOT NULL,
+                    timestamp EPOCH NOT NULL,
+                    FOREIGN KEY (game_id) REFERENCES games (id)
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS player_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    player_id TEXT NOT NULL,
+                    season TEXT NOT NULL,
+                    team_id TEXT,
+                    stats MSGPACK,
+                    recent_form FORM,
+                    updated_at ISO,
+                    UNIQUE (player_id, season)
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS player_last_game_cache (
+                    league TEXT NOT NULL,
+                    team TEXT NOT NULL,
+                    player TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    payload MSGPACK,
+                    fetched_at ISO,
+                    PRIMARY KEY (league, team, player, day)
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS historical_data (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    team_id TEXT NOT NULL,
+                    game_date TEXT NOT NULL,
+                    opponent_id TEXT,
+                    points_for REAL,
+                    points_against REAL,
+                    won INTEGER
+                )
+                """
+            )
+
+            # Composite indexes matching the WHERE/ORDER BY of the hot
+            # get_* queries, so lookups stay B-tree probes as tables grow.
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_games_sport_time"
+                " ON games(sport, start_time, status)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_props_game"
+                " ON player_performance_props(game_id, prop_type, line)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pstats_player_season"
+                " ON player_stats(player_id, season DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_players_team_sport"
+                " ON players(team_id, sport)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_teams_sport ON teams(sport)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_odds_game"
+                " ON fantasy_odds(game_id, market_type)"
+            )
+            # Repeated odds pulls re-insert identical quotes every few
+            # minutes; the unique index plus ON CONFLICT DO NOTHING in
+            # _SQL_INSERT_ODDS keeps the table from growing per refresh.
+            cursor.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_odds ON"
+                " fantasy_odds(game_id, bookmaker, market_type, selection, odds)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_hist_team_date"
+                " ON historical_data(team_id, game_date DESC)"
+            )
+
+        logger.info("Database initialized at %s", self.db_path)
+
+    # --- write helpers -------------------------------------------------
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run a read query on a fresh cursor with a larger fetch batch."""
+        cursor = self._conn.cursor()
+        cursor.arraysize = 200
+        cursor.execute(sql, params)
+        return cursor
+
+    def _executemany(self, sql: str, params: List[tuple]) -> None:
+        """Run ``executemany`` inside one explicit transaction.
+
+        The connection is in autocommit mode (``isolation_level=None``),
+        so BEGIN/COMMIT are issued by hand; the whole batch then pays a
+        single fsync instead of one per row.
+        """
+        if not params:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(sql, params)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def add_team(self, team: Team) -> None:
+        """Insert or replace a team row."""
+        self.add_teams([team])
+
+    def add_teams(self, teams: List[Team]) -> None:
+        """Insert or replace a batch of team rows in one transaction."""
+        params = [
+            (team.id, team.name, team.sport, team.conference, team.division)
+            for team in teams
+        ]
+        self._executemany(_SQL_INSERT_TEAM, params)
+        self._cached_teams_by_sport.cache_clear()
+
+    def add_player(self, player: Player) -> None:
+        """Insert or replace a player row."""
+        self.add_players([player])
+
+    def add_players(self, players: List[Player]) -> None:
+        """Insert or replace a batch of player rows in one transaction."""
+        params = [
+            (player.id, player.name, player.team_id, player.sport, player.position)
+            for player in players
+        ]
+        self._executemany(_SQL_INSERT_PLAYER, params)
+
+    def add_game(self, game: Game) -> None:
+        """Insert or replace a game row."""
+        self.add_games_bulk([game])
+
+    def add_games_bulk(self, games: List[Game]) -> None:
+        """Insert or replace a batch of game rows in one transaction."""
+        params = [
+            (
+                game.id,
+                game.sport,
+                game.home_team,
+                game.away_team,
+                int(game.start_time.timestamp()),
+                game.status,
+            )
+            for game in games
+        ]
+        self._executemany(_SQL_INSERT_GAME, params)
+
+    def add_fantasy_odds(self, odds: Odds) -> None:
+        """Insert a single odds quote."""
+        self.add_fantasy_odds_bulk([odds])
+
+    def add_fantasy_odds_bulk(self, odds_list: List[Odds]) -> None:
+        """Insert a batch of odds quotes in one transaction.
+
+        Amortizes the per-commit fsync over the whole batch, which is the
+        dominant cost when a full odds refresh produces hundreds of rows.
+        """
+        params = [
+            (
+                odds.game_id,
+                odds.bookmaker,
+                odds.market_type,
+                odds.selection,
+                odds.odds,
+                int(odds.timestamp.timestamp()),
+                odds.side,
+            )
+            for odds in odds_list
+        ]
+        self._executemany(_SQL_INSERT_ODDS, params)
+
+    def add_player_performance_prop(self, prop: PlayerProp) -> None:
+        """Insert a single player performance prop."""
+        self.add_player_performance_props_bulk([prop])
+
+    def add_player_performance_props_bulk(self, props: List[PlayerProp]) -> None:
+        """Insert a batch of player props in one transaction."""
+        params = [
+            (
+                prop.game_id,
+                prop.player_id,
+                prop.player_name,
+                prop.prop_type,
+                prop.line,
+                prop.over_odds,
+                prop.under_odds,
+                prop.bookmaker,
+                int(prop.timestamp.timestamp()),
+            )
+            for prop in props
+        ]
+        self._executemany(_SQL_INSERT_PROP, params)
+
+    def add_player_stats(self, player_stats: PlayerStats) -> None:
+        """Insert or replace a player's season stats."""
+        self.add_player_stats_bulk([player_stats])
+
+    def add_player_stats_bulk(self, stats_list: List[PlayerStats]) -> None:
+        """Insert or replace a batch of season stats in one transaction.
+
+        Serialization happens up front while building the parameter list
+        so it does not stall the SQLite write path mid-transaction.  Stats
+        dicts are stored as MessagePack BLOBs (smaller and several times
+        faster to decode than JSON text) and recent form bit-packed into
+        a single INTEGER, one bit per game.
+        """
+        now = datetime.now().isoformat()
+        params = [
+            (
+                ps.player_id,
+                ps.season,
+                ps.team_id,
+                msgpack.packb(ps.stats, use_bin_type=True),
+                _pack_recent_form(ps.recent_form),
+                now,
+            )
+            for ps in stats_list
+        ]
+        self._executemany(_SQL_INSERT_PLAYER_STATS, params)
+        self._cached_player_stats.cache_clear()
+
+    def add_historical_result(
+        self,
+        team_id: str,
+        game_date: datetime,
+        opponent_id: str,
+        points_for: float,
+        points_against: float,
+        won: bool,
+    ) -> None:
+        """Record a finished game for a team."""
+        self._executemany(
+            _SQL_INSERT_HISTORY,
+            [
+                (
+                    team_id,
+                    game_date.isoformat(),
+                    opponent_id,
+                    points_for,
+                    points_against,
+                    int(won),
+                )
+            ],
+        )
+
+    # --- read helpers --------------------------------------------------
+
+    def get_teams_by_sport(self, sport: str) -> List[Team]:
+        """Return all teams for a sport (cached until the next write)."""
+        return self._cached_teams_by_sport(sport)
+
+    def _fetch_teams_by_sport(self, sport: str) -> List[Team]:
+        return list(self.iter_teams_by_sport(sport))
+
+    def iter_teams_by_sport(self, sport: str):
+        """Yield teams for a sport one row at a time."""
+        cursor = self._execute(_SQL_SELECT_TEAMS_BY_SPORT, (sport,))
+        # Column order matches the dataclass field order, so rows can be
+        # splatted positionally (cheaper than kwargs construction).
+        for row in cursor:
+            yield Team(*row)
+
+    def get_players_by_team(self, team_id: str, sport: str) -> List[Player]:
+        """Return all players on a team."""
+        return list(self.iter_players_by_team(team_id, sport))
+
+    def iter_players_by_team(self, team_id: str, sport: str):
+        """Yield players on a team one row at a time."""
+        cursor = self._execute(_SQL_SELECT_PLAYERS_BY_TEAM, (team_id, sport))
+        for row in cursor:
+            yield Player(*row)
+
+    def get_upcoming_games(self, sport: str, days_ahead: int = 7) -> List[Game]:
+        """Return games for a sport starting within the next ``days_ahead`` days."""
+        return list(self.iter_upcoming_games(sport, days_ahead))
+
+    def iter_upcoming_games(self, sport: str, days_ahead: int = 7):
+        """Yield upcoming games one row at a time.
+
+        SQLite cursors fetch roughly a page at a time, so callers that
+        stop early (e.g. only the first few games) never materialize the
+        full result set.
+        """
+        now = datetime.now()
+        cutoff = now + timedelta(days=days_ahead)
+        cursor = self._execute(
+            _SQL_SELECT_UPCOMING_GAMES,
+            (sport, int(now.timestamp()), int(cutoff.timestamp())),
+        )
+        for row in cursor:
+            yield Game(*row)
+
+    def get_player_performance_props_for_game(self, game_id: str) -> List[PlayerProp]:
+        """Return all player props attached to a game."""
+        return list(self.iter_player_performance_props_for_game(game_id))
+
+    def iter_player_performance_props_for_game(self, game_id: str):
+        """Yield player props for a game one row at a time."""
+        cursor = self._execute(_SQL_SELECT_PROPS_FOR_GAME, (game_id,))
+        for row in cursor:
+            yield PlayerProp(*row)
+
+    def get_cached_player_last_game(
+        self,
+        league: str,
+        team: str,
+        player: str,
+        day: str,
+        max_age_hours: float = 6.0,
+    ) -> Optional[tuple]:
+        """Look up a cached last-game payload for one player.
+
+        Returns ``None`` on a miss or an expired row, and a 1-tuple
+        ``(payload,)`` on a hit -- the payload itself may be None when
+        the original fetch found no box-score line, and that negative
+        result is worth caching too.
+        """
+        row = self._execute(
+            _SQL_SELECT_PLAYER_GAME_CACHE, (league, team, player, day)
+        ).fetchone()
+        if row is None:
+            return None
+        payload, fetched_at = row
+        if fetched_at is None or datetime.now() - fetched_at > timedelta(
+            hours=max_age_hours
+        ):
+            return None
+        return (payload,)
+
+    def store_cached_player_last_game(
+        self,
+        league: str,
+        team: str,
+        player: str,
+        day: str,
+        payload: Optional[Dict],
+    ) -> None:
+        """Upsert one player's last-game payload for ``day``."""
+        packed = (
+            msgpack.packb(payload, use_bin_type=True)
+            if payload is not None
+            else None
+        )
+        self._executemany(
+            _SQL_INSERT_PLAYER_GAME_CACHE,
+            [(league, team, player, day, packed, datetime.now().isoformat())],
+        )
+
+    def get_player_performance_props_for_games(
+        self, game_ids: List[str]
+    ) -> Dict[str, List[PlayerProp]]:
+        """Return props for many games in one query, keyed by game id.
+
+        Collapses the per-game round-trips of a slate-wide analysis pass
+        into a single IN-list SELECT; games without props map to empty
+        lists so callers need no membership checks.
+        """
+        props_by_game: Dict[str, List[PlayerProp]] = {
+            game_id: [] for game_id in game_ids
+        }
+        if game_ids:
+            sql = _SQL_SELECT_PROPS_FOR_GAMES % ",".join("?" * len(game_ids))
+            for row in self._execute(sql, tuple(game_ids)):
+                prop = PlayerProp(*row)
+                props_by_game[prop.game_id].append(prop)
+        return props_by_game
+
+    def get_player_stats_bulk(
+        self, player_ids: List[str]
+    ) -> Dict[str, PlayerStats]:
+        """Return the latest season stats for many players in one query.
+
+        Rows come back season-descending, so the first row seen per
+        player is the one ``get_player_stats`` would have returned;
+        players with no stored stats are simply absent from the dict.
+        """
+        stats_by_player: Dict[str, PlayerStats] = {}
+        if player_ids:
+            sql = _SQL_SELECT_PLAYER_STATS_BULK % ",".join(
+                "?" * len(player_ids)
+            )
+            for row in self._execute(sql, tuple(player_ids)):
+                if row[0] not in stats_by_player:
+                    stats_by_player[row[0]] = PlayerStats(*row)
+        return stats_by_player
+
+    def get_player_stats(self, player_id: str, season: Optional[str] = None) -> Optional[PlayerStats]:
+        """Return season stats for a player (cached until the next write)."""
+        return self._cached_player_stats(player_id, season)
+
+    def _fetch_player_stats(self, player_id: str, season: Optional[str]) -> Optional[PlayerStats]:
+        if season is not None:
+            cursor = self._execute(_SQL_SELECT_PLAYER_STATS_SEASON, (player_id, season))
+        else:
+            cursor = self._execute(_SQL_SELECT_PLAYER_STATS_LATEST, (player_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return PlayerStats(*row)
+
+    def get_fantasy_odds_for_game(self, game_id: str) -> List[Odds]:
+        """Return all odds quotes attached to a game."""
+        cursor = self._execute(_SQL_SELECT_ODDS_FOR_GAME, (game_id,))
+        rows = cursor.fetchall()
+        return [Odds(*row) for row in rows]
@@ -0,0 +1,265 @@
+"""Runnable examples for the calculator CLI app."""
+
+import io
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fantasy_calculator_main import analyze_prop_value_batch, get_app
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadLocalStdout:
+    """Routes each thread's print() output to its own buffer.
+
+    contextlib.redirect_stdout swaps the global sys.stdout, which races
+    when examples run in parallel; this proxy keeps the capture
+    per-thread so each example's output stays in one piece.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer) -> None:
+        self._local.buffer = buffer
+
+    def write(self, text) -> int:
+        return getattr(self._local, "buffer", self._fallback).write(text)
+
+    def flush(self) -> None:
+        getattr(self._local, "buffer", self._fallback).flush()
+
+
+def example_nfl_player_props():
+    """Score an NFL quarterback's standard prop lines."""
+    print("=== NFL Player Props ===")
+    app = get_app()
+    results = app.calculate_player_props(
+        sport="nfl",
+        team="Cowboys",
+        player_name="Dak Prescott",
+        prop_types=["passing_yards", "passing_tds"],
+    )
+    app.print_player_props("Dak Prescott", results)
+
+
+def example_nfl_team_props():
+    """Score an NFL matchup across moneyline, spread and total."""
+    print("=== NFL Team Props ===")
+    app = get_app()
+    results = app.calculate_team_props(
+        sport="nfl",
+        home_team={
+            "team_name": "Cowboys",
+            "wins": 9,
+            "losses": 4,
+            "points_for": 27.2,
+            "points_against": 20.1,
+            "recent_form": [True, True, False, True, True],
+            "home_record": [6, 1],
+            "away_record": [3, 3],
+        },
+        away_team={
+            "team_name": "Eagles",
+            "wins": 10,
+            "losses": 3,
+            "points_for": 26.8,
+            "points_against": 21.4,
+            "recent_form": [True, False, True, True, True],
+            "home_record": [5, 1],
+            "away_record": [5, 2],
+        },
+        spread=-2.5,
+        total=48.5,
+    )
+    app.print_team_props(results)
+
+
+def example_nba_player_props():
+    """Score an NBA scorer's points/rebounds/assists lines."""
+    print("=== NBA Player Props ===")
+    app = get_app()
+    results = app.calculate_player_props(
+        sport="nba",
+        team="Lakers",
+        player_name="LeBron James",
+        prop_types=["points", "rebounds", "assists"],
+    )
+    app.print_player_props("LeBron James", results)
+
+
+def example_nba_team_props():
+    """Score an NBA matchup's moneyline and total."""
+    print("=== NBA Team Props ===")
+    app = get_app()
+    results = app.calculate_team_props(
+        sport="nba",
+        home_team={
+            "team_name": "Lakers",
+            "wins": 30,
+            "losses": 15,
+            "points_for": 114.2,
+            "points_against": 110.5,
+            "recent_form": [True, True, True, False, True],
+            "home_record": [18, 5],
+            "away_record": [12, 10],
+        },
+        away_team={
+            "team_name": "Celtics",
+            "wins": 34,
+            "losses": 11,
+            "points_for": 118.9,
+            "points_against": 108.3,
+            "recent_form": [True, True, False, True, True],
+            "home_record": [20, 3],
+            "away_record": [14, 8],
+        },
+        total=228.5,
+    )
+    app.print_team_props(results)
+
+
+def example_nhl_player_props():
+    """Score an NHL forward's points and shots lines."""
+    print("=== NHL Player Props ===")
+    app = get_app()
+    results = app.calculate_player_props(
+        sport="nhl",
+        team="Oilers",
+        player_name="Connor McDavid",
+        prop_types=["points", "shots_on_goal"],
+    )
+    app.print_player_props("Connor McDavid", results)
+
+
+def example_mlb_player_props():
+    """Score an MLB slugger's hits and total-bases lines."""
+    print("=== MLB Player Props ===")
+    app = get_app()
+    results = app.calculate_player_props(
+        sport="mlb",
+        team="Yankees",
+        player_name="Aaron Judge",
+        prop_types=["hits", "total_bases"],
+    )
+    app.print_player_props("Aaron Judge", results)
+
+
+def example_value_analysis():
+    """Compare a model probability against a quoted price."""
+    print("=== Value Analysis ===")
+    app = get_app()
+    analysis = app.analyze_prop_value(probability=0.58, odds=-110)
+    print(f"Calculated: {analysis['calculated_probability']:.1%}")
+    print(f"Implied: {analysis['implied_probability']:.1%}")
+    print(f"Expected Value: {analysis['expected_value']:.3f}")
+    print(f"Value: {analysis['value_percentage']:.1f}%")
+    print(f"Recommendation: {analysis['recommendation']}")
+
+
+def example_value_analysis_batch():
+    """Score a whole book of (probability, odds) pairs at once."""
+    print("=== Batch Value Analysis ===")
+    probs = [0.58, 0.45, 0.62, 0.51]
+    odds = [-110, 150, -135, 100]
+    batch = analyze_prop_value_batch(probs, odds)
+    for i in range(len(probs)):
+        print(
+            f"p={probs[i]:.2f} @ {odds[i]:+d}: "
+            f"EV {batch['expected_value'][i]:+.3f} "
+            f"-> {batch['recommendation'][i]}"
+        )
+
+
+def example_custom_lines():
+    """Override the default lines with book-specific numbers."""
+    print("=== Custom Lines ===")
+    app = get_app()
+    results = app.calculate_player_props(
+        sport="nba",
+        team="Lakers",
+        player_name="LeBron James",
+        prop_types=["points", "assists"],
+        lines={"points": 25.5, "assists": 7.5},
+    )
+    app.print_player_props("LeBron James", results)
+
+
+def example_bulk_player_props():
+    """Dispatch every player-prop request in one bulk call.
+
+    Grouping by player means one stats fetch each, and all lines for a
+    player are scored in a single vectorized pass.
+    """
+    print("=== Bulk Player Props ===")
+    app = get_app()
+    requests = [
+        {"sport": "nfl", "team": "Cowboys", "player_name": "Dak Prescott",
+         "prop_type": "passing_yards"},
+        {"sport": "nfl", "team": "Cowboys", "player_name": "Dak Prescott",
+         "prop_type": "passing_tds"},
+        {"sport": "nba", "team": "Lakers", "player_name": "LeBron James",
+         "prop_type": "points", "line": 25.5},
+        {"sport": "nba", "team": "Lakers", "player_name": "LeBron James",
+         "prop_type": "assists", "line": 7.5},
+    ]
+    results = app.calculate_player_props_bulk(requests)
+    for request, result in zip(requests, results):
+        if "error" in result:
+            print(f"{request['player_name']} {request['prop_type']}: "
+                  f"error: {result['error']}")
+        else:
+            print(f"{request['player_name']} {request['prop_type']}: "
+                  f"over {result['over_probability']:.1%}")
+
+
+def main():
+    # Grouped by (sport, team) so consecutive examples hit the calculator's
+    # per-team scoreboard cache instead of refetching (Cowboys examples
+    # share one pull, as do the Lakers ones).
+    examples = [
+        example_nfl_player_props,
+        example_nfl_team_props,
+        example_nba_player_props,
+        example_custom_lines,
+        example_nba_team_props,
+        example_nhl_player_props,
+        example_mlb_player_props,
+        example_value_analysis,
+        example_value_analysis_batch,
+        example_bulk_player_props,
+    ]
+    proxy = _ThreadLocalStdout(sys.stdout)
+
+    def run_captured(example) -> str:
+        """Run one example with its stdout captured so output stays whole."""
+        buffer = io.StringIO()
+        proxy.register(buffer)
+        try:
+            example()
+        except Exception as e:
+            logger.error("Example %s failed: %s", example.__name__, e)
+        return buffer.getvalue()
+
+    # The examples are independent and dominated by network latency, so
+    # run them all at once and print the captured output in list order;
+    # wall time collapses to the slowest example.
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+            futures = [
+                executor.submit(run_captured, example) for example in examples
+            ]
+            outputs = [future.result() for future in futures]
+    finally:
+        sys.stdout = original_stdout
+    for output in outputs:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,992 @@
+"""Main application: ingest odds, collect data and surface opportunities."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import heapq
+import logging
+import operator
+import os
+import random
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from models import (
+    SIDE_AWAY,
+    SIDE_HOME,
+    SIDE_OVER,
+    SIDE_UNDER,
+    Game,
+    Odds,
+    PlayerProp,
+    PlayerStats,
+    Team,
+)
+
+# NumPy, numba, requests and the calculator stack dominate import time,
+# so they are pulled in lazily by the code paths that need them; running
+# --help or a trivial subcommand never pays for them.
+if TYPE_CHECKING:
+    import numpy as np
+
+    from probability_calculator import GameContext, TeamStats
+
+logger = logging.getLogger(__name__)
+
+
+def _key_configured(name: str) -> bool:
+    value = os.getenv(name)
+    return bool(value) and value != f"your_{name.lower()}_here"
+
+
+# Key presence is resolved once at import: every CLI subcommand builds a
+# fresh app, and re-reading the environment per instance just repeats
+# the same lookups.
+_HAS_ODDS_KEY = _key_configured("THE_ODDS_API_KEY")
+_CONFIGURED_OPTIONAL_KEYS = tuple(
+    key
+    for key in ("ODDS_API_COM_KEY", "SPORTSDATA_IO_KEY")
+    if _key_configured(key)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an API timestamp, cached since the same strings repeat.
+
+    Every bookmaker entry for a game carries the identical
+    commence_time, and consecutive polling cycles mostly see the same
+    schedule, so parses after the first are dict hits.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_side(selection: str, market_type: str, home_team: str) -> int:
+    """Map a selection string to its canonical side code.
+
+    Done once per quote at ingest so the analysis loops compare ints
+    instead of lowercasing and scanning the selection per row.
+    """
+    lowered = selection.lower()
+    if market_type == "totals":
+        return SIDE_OVER if "over" in lowered else SIDE_UNDER
+    return SIDE_HOME if home_team.lower() in lowered else SIDE_AWAY
+
+
+@functools.lru_cache(maxsize=1)
+def _build_filter_ev():
+    """Compile the EV kernel on first use rather than at import."""
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def kernel(true_probs, payouts, threshold):
+        n = payouts.shape[0]
+        idx = np.empty(n, np.int64)
+        evs = np.empty(n, np.float64)
+        k = 0
+        for i in range(n):
+            # p*payout - (1-p) folded to p*(payout+1) - 1: one fewer
+            # subtraction and no (1-p) temporary per row.
+            ev = true_probs[i] * (payouts[i] + 1.0) - 1.0
+            if ev > threshold:
+                idx[k] = i
+                evs[k] = ev
+                k += 1
+        return idx[:k], evs[:k]
+
+    return kernel
+
+
+def _filter_ev(true_probs, payouts, threshold):
+    """Fused EV + threshold filter over one market's quotes.
+
+    Computes expected value and the cutoff comparison in a single pass
+    with no intermediate arrays; returns the surviving indices and their
+    EV values.
+    """
+    return _build_filter_ev()(true_probs, payouts, threshold)
+
+
+@dataclass(slots=True, frozen=True)
+class Recommendation:
+    """One positive-EV quote surfaced by the analyzers.
+
+    Slotted instead of a dict: a slate can produce thousands of these,
+    and fixed slots cut per-row memory severalfold while making the
+    downstream attrgetter-keyed ranking faster than dict lookups.
+    """
+
+    game_id: str
+    market_type: str
+    selection: str
+    odds: float
+    true_probability: float
+    implied_probability: float
+    expected_value: float
+    confidence: float
+    bookmaker: str
+
+
+class FantasyProbabilityApp:
+    """Ties the scrapers, odds APIs, database and model together."""
+
+    def __init__(self, db_path: str = "fantasy_data.db"):
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        from espn_scraper import ESPNScraper
+        from fantasy_calculator import DatabaseManager
+        from odds_api import OddsManager
+        from probability_calculator import FantasyProbabilityCalculator
+
+        self.db_manager = DatabaseManager(db_path)
+        # One pooled session shared by every HTTP client: the concurrent
+        # per-sport fetches reuse warm connections from the pool instead
+        # of paying a TCP+TLS handshake per request, and transient
+        # failures retry with backoff at the transport layer.
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.http.mount("https://", adapter)
+        self.odds_manager = OddsManager(session=self.http)
+        self.espn_scraper = ESPNScraper(session=self.http)
+        self.prob_calculator = FantasyProbabilityCalculator(self.db_manager)
+        # Per-analysis-run memos: the same teams recur across a slate's
+        # games and props, so each team list, stats snapshot and game
+        # context is built at most once per pass.  Cleared at the start
+        # of every analyze_* call so a run never sees stale standings.
+        self._sport_teams_cache: Dict[str, List[Dict]] = {}
+        self._team_stats_cache: Dict[tuple, Optional[TeamStats]] = {}
+        self._context_cache: Dict[tuple, Optional[GameContext]] = {}
+        # Prop model results survive across polling cycles, but entries
+        # are only admitted with probability 0.3 (accumulator variant):
+        # props seen repeatedly get cached, one-off lines mostly don't,
+        # which bounds the cache without an eviction policy.
+        self._prop_prob_cache: Dict[tuple, Dict] = {}
+        self._prop_cache_accum = 0.0
+        # Fingerprint of the last stored odds batch; the adaptive
+        # monitor uses it to tell quiet pulls from real line movement.
+        self._odds_fingerprint: Optional[int] = None
+        self._odds_changed = False
+        self._check_api_keys()
+
+    def _clear_analysis_caches(self) -> None:
+        self._sport_teams_cache.clear()
+        self._team_stats_cache.clear()
+        self._context_cache.clear()
+
+    # Set once the key status has been logged, so repeated app
+    # construction (one per CLI subcommand, many per test run) emits the
+    # lines a single time per process.
+    _keys_checked = False
+
+    def _check_api_keys(self) -> None:
+        """Log which odds API keys are configured, once per process."""
+        if FantasyProbabilityApp._keys_checked:
+            return
+        FantasyProbabilityApp._keys_checked = True
+        if _HAS_ODDS_KEY:
+            logger.info("THE_ODDS_API_KEY configured")
+        else:
+            logger.warning("THE_ODDS_API_KEY missing; odds ingestion disabled")
+        for key in _CONFIGURED_OPTIONAL_KEYS:
+            logger.info("%s configured", key)
+
+    # --- ingestion -----------------------------------------------------
+
+    def update_odds(self, sports: Optional[List[str]] = None) -> None:
+        """Pull current odds for each sport and store them.
+
+        Rows are accumulated across the whole refresh and written with the
+        bulk insert helpers at the end, so the database sees one
+        transaction per table instead of one commit per outcome.
+
+        The per-sport fetches are independent HTTP calls, so they run
+        concurrently; total fetch latency is roughly the slowest sport
+        rather than the sum.  Processing and the DB flush stay on the
+        calling thread, which keeps the shared batches and the SQLite
+        connection single-threaded.
+        """
+        if sports is None:
+            sports = ["nfl", "nba", "mlb", "nhl"]
+        if not sports:
+            # argparse allows --sports with no values; nothing to fetch,
+            # and ThreadPoolExecutor rejects max_workers=0.
+            return
+
+        games_batch: Dict[str, Game] = {}
+        odds_batch: List[Odds] = []
+        with ThreadPoolExecutor(max_workers=min(len(sports), 6)) as executor:
+            futures = {
+                executor.submit(self.odds_manager.get_odds_for_sport, s): s
+                for s in sports
+            }
+            for future in as_completed(futures):
+                sport_name = futures[future]
+                try:
+                    odds_data_list = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {sport_name} odds: {e}")
+                    continue
+                self._process_odds_data(
+                    sport_name, odds_data_list, games_batch, odds_batch
+                )
+
+        fingerprint = hash(
+            tuple(
+                sorted(
+                    (o.game_id, o.bookmaker, o.market_type, o.selection, o.odds)
+                    for o in odds_batch
+                )
+            )
+        )
+        self._odds_changed = fingerprint != self._odds_fingerprint
+        self._odds_fingerprint = fingerprint
+
+        self.db_manager.add_games_bulk(list(games_batch.values()))
+        self.db_manager.add_fantasy_odds_bulk(odds_batch)
+        logger.info(
+            f"Stored {len(odds_batch)} odds across {len(games_batch)} games"
+        )
+
+    def _process_odds_data(
+        self,
+        sport: str,
+        odds_data_list: List[Dict],
+        games_batch: Dict[str, Game],
+        odds_batch: List[Odds],
+    ) -> None:
+        """Turn one sport's API payload into Game and Odds rows."""
+        # One wall-clock read stamps the whole payload; the per-outcome
+        # datetime.now() syscall was pure overhead at this granularity.
+        now = datetime.now()
+        for odds_data in odds_data_list:
+            try:
+                game_id = odds_data.get("id")
+                if game_id is None:
+                    continue
+                home_team = odds_data.get("home_team", "Unknown")
+                if game_id not in games_batch:
+                    start_time = _parse_iso(odds_data.get("commence_time", ""))
+                    games_batch[game_id] = Game(
+                        id=game_id,
+                        sport=sport,
+                        home_team=home_team,
+                        away_team=odds_data.get("away_team", "Unknown"),
+                        start_time=start_time,
+                    )
+                for bookmaker in odds_data.get("bookmakers", []):
+                    bookmaker_key = bookmaker.get("key", "unknown")
+                    for market in bookmaker.get("markets", []):
+                        market_type = market.get("key", "unknown")
+                        for outcome in market.get("outcomes", []):
+                            selection = outcome.get("name", "Unknown")
+                            side = _classify_side(
+                                selection, market_type, home_team
+                            )
+                            point = outcome.get("point")
+                            if point is not None:
+                                selection = f"{selection} {point}"
+                            odds_batch.append(
+                                Odds(
+                                    game_id=game_id,
+                                    bookmaker=bookmaker_key,
+                                    market_type=market_type,
+                                    selection=selection,
+                                    odds=outcome.get("price", 0),
+                                    timestamp=now,
+                                    side=side,
+                                )
+                            )
+            except Exception as e:
+                logger.error("Error processing odds data: %s", e)
+
+    def update_player_props(self, sports: Optional[List[str]] = None) -> None:
+        """Pull current player prop lines for each sport and store them."""
+        if sports is None:
+            sports = ["nfl", "nba", "mlb", "nhl"]
+        if not sports:
+            return
+
+        props_batch: List[PlayerProp] = []
+        with ThreadPoolExecutor(max_workers=min(len(sports), 6)) as executor:
+            futures = {
+                executor.submit(
+                    self.odds_manager.get_player_props_for_sport, s
+                ): s
+                for s in sports
+            }
+            for future in as_completed(futures):
+                sport_name = futures[future]
+                try:
+                    props_data = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {sport_name} props: {e}")
+                    continue
+                self._process_player_prop_data(
+                    sport_name, props_data, props_batch
+                )
+
+        self.db_manager.add_player_performance_props_bulk(props_batch)
+        logger.info(f"Stored {len(props_batch)} player props")
+
+    def _process_player_prop_data(
+        self, sport: str, props_data: List[Dict], props_batch: List[PlayerProp]
+    ) -> None:
+        """Turn one sport's player-prop payload into PlayerProp rows."""
+        now = datetime.now()
+        prop_type_map = {
+            "player_pass_yds": "passing_yards",
+            "player_pass_tds": "passing_tds",
+            "player_rush_yds": "rushing_yards",
+            "player_points": "points",
+            "player_rebounds": "rebounds",
+            "player_assists": "assists",
+            "player_shots_on_goal": "shots_on_goal",
+            "batter_hits": "hits",
+            "batter_total_bases": "total_bases",
+        }
+        for event in props_data:
+            try:
+                game_id = event.get("id")
+                if game_id is None:
+                    continue
+                for bookmaker in event.get("bookmakers", []):
+                    bookmaker_key = bookmaker.get("key", "unknown")
+                    for market in bookmaker.get("markets", []):
+                        prop_type = prop_type_map.get(
+                            market.get("key"), market.get("key", "unknown")
+                        )
+                        lines: Dict[tuple, Dict] = {}
+                        for outcome in market.get("outcomes", []):
+                            player_name = outcome.get("description", "Unknown")
+                            line = outcome.get("point", 0.0)
+                            entry = lines.setdefault(
+                                (player_name, line),
+                                {"over": 0.0, "under": 0.0},
+                            )
+                            side = outcome.get("name", "").lower()
+                            if side in entry:
+                                entry[side] = outcome.get("price", 0)
+                        for (player_name, line), prices in lines.items():
+                            props_batch.append(
+                                PlayerProp(
+                                    game_id=game_id,
+                                    player_id=player_name.lower().replace(" ", "-"),
+                                    player_name=player_name,
+                                    prop_type=prop_type,
+                                    line=line,
+                                    over_odds=prices["over"],
+                                    under_odds=prices["under"],
+                                    bookmaker=bookmaker_key,
+                                    timestamp=now,
+                                )
+                            )
+            except Exception as e:
+                logger.error("Error processing player prop data: %s", e)
+
+    def collect_player_data(self, sports: Optional[List[str]] = None) -> None:
+        """Refresh teams and rosters from ESPN."""
+        if sports is None:
+            sports = ["nfl", "nba", "mlb", "nhl"]
+        for sport_name in sports:
+            try:
+                teams = self.espn_scraper.get_teams(sport_name)
+                self.db_manager.add_teams(
+                    [
+                        Team(id=t["id"], name=t["name"], sport=sport_name)
+                        for t in teams
+                        if t.get("id")
+                    ]
+                )
+                logger.info(f"Stored {len(teams)} {sport_name} teams")
+            except Exception as e:
+                logger.error(f"Error collecting {sport_name} team data: {e}")
+
+    # --- analysis ------------------------------------------------------
+
+    def analyze_fantasy_opportunities(
+        self, sports: Optional[List[str]] = None
+    ) -> List[Recommendation]:
+        """Scan stored game odds for positive expected value."""
+        if sports is None:
+            sports = ["nfl", "nba", "mlb", "nhl"]
+
+        self._clear_analysis_caches()
+        all_recommendations = []
+        for sport_name in sports:
+            games = self.db_manager.get_upcoming_games(sport_name)
+            for game in games:
+                try:
+                    game_context = self._create_game_context(game)
+                    if game_context is None:
+                        continue
+                    odds_list = self.db_manager.get_fantasy_odds_for_game(game.id)
+                    all_recommendations.extend(
+                        self._analyze_game_markets(game, game_context, odds_list)
+                    )
+                except Exception as e:
+                    logger.error("Error analyzing game %s: %s", game.id, e)
+
+        # Only the leaders are ever consumed downstream, so keep a
+        # k-sized heap (O(N log k)) instead of sorting the whole slate.
+        return heapq.nlargest(
+            200, all_recommendations, key=operator.attrgetter("expected_value")
+        )
+
+    def analyze_player_prop_opportunities(
+        self, sports: Optional[List[str]] = None
+    ) -> List[Recommendation]:
+        """Scan stored player props for positive expected value."""
+        if sports is None:
+            sports = ["nfl", "nba", "mlb", "nhl"]
+
+        self._clear_analysis_caches()
+        all_recommendations = []
+        for sport_name in sports:
+            games = self.db_manager.get_upcoming_games(sport_name)
+            # DataLoader-style prefetch: one IN-list query for the
+            # sport's props and one for every referenced player's stats,
+            # instead of a round-trip per game plus one per prop.
+            props_by_game = self.db_manager.get_player_performance_props_for_games(
+                [game.id for game in games]
+            )
+            player_stats_map = self.db_manager.get_player_stats_bulk(
+                list(
+                    {
+                        prop.player_id
+                        for props in props_by_game.values()
+                        for prop in props
+                    }
+                )
+            )
+            for game in games:
+                try:
+                    game_context = self._create_game_context(game)
+                    if game_context is None:
+                        continue
+                    all_recommendations.extend(
+                        self._analyze_player_props(
+                            game,
+                            game_context,
+                            props_by_game[game.id],
+                            player_stats_map,
+                        )
+                    )
+                except Exception as e:
+                    logger.error("Error analyzing props for %s: %s", game.id, e)
+
+        # Only the leaders are ever consumed downstream, so keep a
+        # k-sized heap (O(N log k)) instead of sorting the whole slate.
+        return heapq.nlargest(
+            200, all_recommendations, key=operator.attrgetter("expected_value")
+        )
+
+    # Market key -> analyzer method, resolved once per group instead of
+    # re-testing membership per market in an if-chain.
+    _MARKET_HANDLERS = {
+        "h2h": "_analyze_game_outcomes",
+        "spreads": "_analyze_point_differentials",
+        "totals": "_analyze_total_points",
+    }
+
+    def _analyze_game_markets(
+        self, game: Game, game_context: GameContext, odds_list: List[Odds]
+    ) -> List[Recommendation]:
+        """Route a game's odds to the per-market analyzers."""
+        market_groups: Dict[str, List[Odds]] = defaultdict(list)
+        for odds in odds_list:
+            market_groups[odds.market_type].append(odds)
+
+        recommendations = []
+        for key, handler_name in self._MARKET_HANDLERS.items():
+            group = market_groups.get(key)
+            if group:
+                recommendations.extend(
+                    getattr(self, handler_name)(game, game_context, group)
+                )
+        return recommendations
+
+    @staticmethod
+    def _payouts_and_implied(odds_arr: np.ndarray) -> tuple:
+        """Vectorized American-odds conversion for a market's quotes."""
+        import numpy as np
+
+        payouts = np.where(odds_arr > 0, odds_arr / 100.0, 100.0 / -odds_arr)
+        implied = 1.0 / (1.0 + payouts)
+        return payouts, implied
+
+    @staticmethod
+    def _alive_rows(payouts: np.ndarray, prob_cap) -> np.ndarray:
+        """Indices of quotes that could still clear the EV threshold.
+
+        ev > 0.05 requires true_prob > 1.05 / (payout + 1), so any quote
+        whose required probability exceeds the cap on what the model can
+        assign is dead on arrival; dropping those rows up front keeps
+        the EV kernel off longshots and heavy favorites that trivially
+        fail the cutoff.
+        """
+        import numpy as np
+
+        min_probs = 1.05 / (payouts + 1.0)
+        return np.flatnonzero(min_probs < prob_cap)
+
+    def _analyze_game_outcomes(
+        self, game: Game, game_context: GameContext, odds_list: List[Odds]
+    ) -> List[Recommendation]:
+        """Look for value in moneyline quotes.
+
+        The EV math runs once over whole NumPy arrays rather than per
+        quote in the interpreter; only rows clearing the value threshold
+        are materialized as recommendation dicts.
+        """
+        if not odds_list:
+            return []
+        import numpy as np
+
+        probs = self.prob_calculator.calculate_team_moneyline_probability(
+            game_context
+        )
+        n = len(odds_list)
+        is_home = np.fromiter(
+            (o.side == SIDE_HOME for o in odds_list), dtype=np.bool_, count=n
+        )
+        odds_arr = np.fromiter(
+            (o.odds for o in odds_list), dtype=np.float64, count=n
+        )
+        true_probs = np.where(
+            is_home, probs["home_win_probability"], probs["away_win_probability"]
+        )
+        payouts, implied = self._payouts_and_implied(odds_arr)
+        alive = self._alive_rows(
+            payouts,
+            max(probs["home_win_probability"], probs["away_win_probability"]),
+        )
+        if alive.size == 0:
+            return []
+        idx, evs = _filter_ev(true_probs[alive], payouts[alive], 0.05)
+        idx = alive[idx]
+
+        recommendations = []
+        for j, i in enumerate(idx):
+            odds = odds_list[i]
+            recommendations.append(
+                Recommendation(
+                    game_id=game.id,
+                    market_type="h2h",
+                    selection=odds.selection,
+                    odds=odds.odds,
+                    true_probability=float(true_probs[i]),
+                    implied_probability=float(implied[i]),
+                    expected_value=float(evs[j]),
+                    confidence=probs["confidence"],
+                    bookmaker=odds.bookmaker,
+                )
+            )
+        return recommendations
+
+    def _analyze_point_differentials(
+        self, game: Game, game_context: GameContext, odds_list: List[Odds]
+    ) -> List[Recommendation]:
+        """Look for value in spread quotes.
+
+        All of a market's lines go through the calculator's fused slate
+        kernel in one call, then the EV filter runs vectorized.
+        """
+        rows = []
+        for odds in odds_list:
+            try:
+                rows.append((odds, float(odds.selection.split()[-1])))
+            except (ValueError, IndexError):
+                continue
+        if not rows:
+            return []
+        import numpy as np
+
+        n = len(rows)
+        spreads = np.fromiter((line for _, line in rows), np.float64, count=n)
+        probs = self.prob_calculator.calculate_game_probabilities_batch(
+            [game_context] * n, spreads, np.zeros(n)
+        )
+        is_home = np.fromiter(
+            (o.side == SIDE_HOME for o, _ in rows), dtype=np.bool_, count=n
+        )
+        odds_arr = np.fromiter((o.odds for o, _ in rows), np.float64, count=n)
+        true_probs = np.where(
+            is_home, probs["cover_probability"], 1.0 - probs["cover_probability"]
+        )
+        payouts, implied = self._payouts_and_implied(odds_arr)
+        caps = np.maximum(
+            probs["cover_probability"], 1.0 - probs["cover_probability"]
+        )
+        alive = self._alive_rows(payouts, caps)
+        if alive.size == 0:
+            return []
+        idx, evs = _filter_ev(true_probs[alive], payouts[alive], 0.05)
+        idx = alive[idx]
+        confidence = self.prob_calculator._calculate_confidence(
+            game_context.home_team, game_context.away_team
+        )
+
+        recommendations = []
+        for j, i in enumerate(idx):
+            odds = rows[i][0]
+            recommendations.append(
+                Recommendation(
+                    game_id=game.id,
+                    market_type="spreads",
+                    selection=odds.selection,
+                    odds=odds.odds,
+                    true_probability=float(true_probs[i]),
+                    implied_probability=float(implied[i]),
+                    expected_value=float(evs[j]),
+                    confidence=confidence,
+                    bookmaker=odds.bookmaker,
+                )
+            )
+        return recommendations
+
+    def _analyze_total_points(
+        self, game: Game, game_context: GameContext, odds_list: List[Odds]
+    ) -> List[Recommendation]:
+        """Look for value in totals quotes, vectorized like the spreads."""
+        rows = []
+        for odds in odds_list:
+            try:
+                rows.append((odds, float(odds.selection.split()[-1])))
+            except (ValueError, IndexError):
+                continue
+        if not rows:
+            return []
+        import numpy as np
+
+        n = len(rows)
+        totals = np.fromiter((line for _, line in rows), np.float64, count=n)
+        probs = self.prob_calculator.calculate_game_probabilities_batch(
+            [game_context] * n, np.zeros(n), totals
+        )
+        is_over = np.fromiter(
+            (o.side == SIDE_OVER for o, _ in rows), dtype=np.bool_, count=n
+        )
+        odds_arr = np.fromiter((o.odds for o, _ in rows), np.float64, count=n)
+        true_probs = np.where(
+            is_over, probs["over_probability"], probs["under_probability"]
+        )
+        payouts, implied = self._payouts_and_implied(odds_arr)
+        caps = np.maximum(
+            probs["over_probability"], probs["under_probability"]
+        )
+        alive = self._alive_rows(payouts, caps)
+        if alive.size == 0:
+            return []
+        idx, evs = _filter_ev(true_probs[alive], payouts[alive], 0.05)
+        idx = alive[idx]
+        confidence = self.prob_calculator._calculate_confidence(
+            game_context.home_team, game_context.away_team
+        )
+
+        recommendations = []
+        for j, i in enumerate(idx):
+            odds = rows[i][0]
+            recommendations.append(
+                Recommendation(
+                    game_id=game.id,
+                    market_type="totals",
+                    selection=odds.selection,
+                    odds=odds.odds,
+                    true_probability=float(true_probs[i]),
+                    implied_probability=float(implied[i]),
+                    expected_value=float(evs[j]),
+                    confidence=confidence,
+                    bookmaker=odds.bookmaker,
+                )
+            )
+        return recommendations
+
+    def _analyze_player_props(
+        self,
+        game: Game,
+        game_context: GameContext,
+        props: List[PlayerProp],
+        player_stats_map: Dict[str, PlayerStats],
+    ) -> List[Recommendation]:
+        """Look for value in stored player prop lines."""
+        recommendations = []
+        for prop in props:
+            try:
+                player_stats = player_stats_map.get(prop.player_id)
+                if player_stats is None:
+                    continue
+                # One model evaluation covers both sides: over and under
+                # probabilities come from the same distribution.
+                cache_key = (prop.player_id, prop.prop_type, prop.line, game.id)
+                prob = self._prop_prob_cache.get(cache_key)
+                if prob is None:
+                    prob = self.prob_calculator.calculate_player_prop_probability(
+                        game.sport,
+                        player_stats.team_id,
+                        prop.player_name,
+                        prop.prop_type,
+                        prop.line,
+                        game_context,
+                    )
+                    self._prop_cache_accum += 0.3
+                    if self._prop_cache_accum >= 1.0:
+                        self._prop_cache_accum -= 1.0
+                        self._prop_prob_cache[cache_key] = prob
+
+                for side, true_prob, quoted in (
+                    ("over", prob["over_probability"], prop.over_odds),
+                    ("under", prob["under_probability"], prop.under_odds),
+                ):
+                    if not quoted:
+                        continue
+                    implied_prob = self.odds_manager.convert_american_to_probability(
+                        quoted
+                    )
+                    decimal = self.odds_manager.convert_american_to_decimal(
+                        quoted
+                    )
+                    expected_value = true_prob * decimal - 1.0
+                    if expected_value > 0.05:
+                        recommendations.append(
+                            Recommendation(
+                                game_id=game.id,
+                                market_type="player_props",
+                                selection=(
+                                    f"{prop.player_name} {side} "
+                                    f"{prop.line} {prop.prop_type}"
+                                ),
+                                odds=quoted,
+                                true_probability=true_prob,
+                                implied_probability=implied_prob,
+                                expected_value=expected_value,
+                                confidence=prob["confidence"],
+                                bookmaker=prop.bookmaker,
+                            )
+                        )
+            except Exception as e:
+                logger.error("Error analyzing prop for %s: %s", prop.player_name, e)
+        return recommendations
+
+    # --- context helpers -----------------------------------------------
+
+    def _get_team_stats(self, team_name: str, sport: str) -> Optional[TeamStats]:
+        """Build a TeamStats snapshot for a team from ESPN's standings.
+
+        Memoized per analysis run: the standings feed is fetched once
+        per sport and each team's snapshot is built once, however many
+        games and props it appears in.
+        """
+        key = (team_name, sport)
+        if key in self._team_stats_cache:
+            return self._team_stats_cache[key]
+        teams = self._sport_teams_cache.get(sport)
+        if teams is None:
+            try:
+                teams = self.espn_scraper.get_teams(sport)
+            except Exception as e:
+                logger.error(f"Error fetching {sport} teams: {e}")
+                teams = []
+            self._sport_teams_cache[sport] = teams
+        stats = self._build_team_stats(team_name, sport, teams)
+        self._team_stats_cache[key] = stats
+        return stats
+
+    def _build_team_stats(
+        self, team_name: str, sport: str, teams: List[Dict]
+    ) -> Optional[TeamStats]:
+        from probability_calculator import TeamStats
+
+        query = team_name.lower()
+        for team in teams:
+            if query in (team.get("name") or "").lower():
+                sport_info = self.prob_calculator.SPORT_STATS.get(
+                    sport, self.prob_calculator.SPORT_STATS["nfl"]
+                )
+                return TeamStats(
+                    team_name=team["name"],
+                    wins=team.get("wins", 0),
+                    losses=team.get("losses", 0),
+                    points_for=sport_info["avg_points"] / 2.0,
+                    points_against=sport_info["avg_points"] / 2.0,
+                    recent_form=[],
+                    home_record=[0, 0],
+                    away_record=[0, 0],
+                )
+        return None
+
+    def _create_game_context(self, game: Game) -> Optional[GameContext]:
+        """Assemble the model's GameContext for a stored game (memoized)."""
+        from probability_calculator import GameContext
+
+        key = (game.home_team, game.away_team, game.sport)
+        if key in self._context_cache:
+            return self._context_cache[key]
+        home_stats = self._get_team_stats(game.home_team, game.sport)
+        away_stats = self._get_team_stats(game.away_team, game.sport)
+        if home_stats is None or away_stats is None:
+            context = None
+        else:
+            context = GameContext(
+                sport=game.sport, home_team=home_stats, away_team=away_stats
+            )
+        self._context_cache[key] = context
+        return context
+
+    # --- monitoring ----------------------------------------------------
+
+    async def start_monitoring(self, interval_minutes: int = 60) -> None:
+        """Refresh and analyze on a fixed cadence until cancelled.
+
+        The refresh and analysis cycles are independent periodic tasks on
+        one event loop, so they tick on their own cadence without the
+        minute of scheduling jitter (and the pinned thread) the old
+        schedule + time.sleep(60) loop imposed.  The sync bodies run in
+        the default executor so the loop stays responsive.
+        """
+        logger.info(f"Starting monitoring every {interval_minutes} minutes")
+        await asyncio.gather(
+            self._adaptive_periodic(interval_minutes * 60, self._refresh_cycle),
+            self._periodic(3600, self._analysis_cycle),
+        )
+
+    async def _adaptive_periodic(
+        self, base_interval: float, fn: Callable
+    ) -> None:
+        """Run ``fn`` on a cadence that tracks odds volatility.
+
+        A pull that stored the same odds as last time stretches the
+        next wait by 1.5x (capped at four times the base interval); a
+        pull that saw line movement halves it (floored at a quarter of
+        the base).  +-20% jitter keeps the polls from falling into
+        lockstep with other consumers of the same rate-limited APIs.
+        """
+        loop = asyncio.get_running_loop()
+        interval = float(base_interval)
+        while True:
+            try:
+                await loop.run_in_executor(None, fn)
+            except Exception as e:
+                logger.error(f"Monitoring task {fn.__name__} failed: {e}")
+            if self._odds_changed:
+                interval = max(base_interval / 4.0, interval / 2.0)
+            else:
+                interval = min(base_interval * 4.0, interval * 1.5)
+            logger.debug("Next %s in %.0fs", fn.__name__, interval)
+            await asyncio.sleep(interval * random.uniform(0.8, 1.2))
+
+    async def _periodic(self, interval_seconds: float, fn: Callable) -> None:
+        """Run ``fn`` immediately and then every ``interval_seconds``."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, fn)
+            except Exception as e:
+                logger.error(f"Monitoring task {fn.__name__} failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def _refresh_cycle(self) -> None:
+        """One odds-and-props refresh pass."""
+        self.prob_calculator.clear_cache()
+        self.update_odds()
+        self.update_player_props()
+
+    def _analysis_cycle(self) -> None:
+        """One analysis pass over whatever is currently stored."""
+        opportunities = self.analyze_fantasy_opportunities()
+        opportunities.extend(self.analyze_player_prop_opportunities())
+        self._log_opportunities(opportunities)
+
+    @staticmethod
+    def format_opportunities(opportunities: List[Recommendation]) -> str:
+        """Render a full opportunity report as one string.
+
+        The report is assembled in memory and written with a single
+        stream call; emitting each field separately costs a dispatch
+        and flush per line, which adds up when a report runs to
+        hundreds of rows.
+        """
+        if not opportunities:
+            return "No value opportunities found\n"
+        chunks = [f"Found {len(opportunities)} value opportunities\n"]
+        ranked = sorted(
+            opportunities,
+            key=operator.attrgetter("expected_value"),
+            reverse=True,
+        )
+        for i, opp in enumerate(ranked, start=1):
+            chunks.append(
+                f"{i}. [{opp.market_type}] {opp.selection} @ {opp.odds:g}"
+                f" ({opp.bookmaker})\n"
+                f"   Expected value: {opp.expected_value:.3f}\n"
+                f"   True probability: {opp.true_probability:.3f}"
+                f" (implied {opp.implied_probability:.3f})\n"
+                f"   Confidence: {opp.confidence:.2f}\n"
+            )
+        return "".join(chunks)
+
+    def _log_opportunities(self, opportunities: List[Recommendation]) -> None:
+        """Log the best opportunities from the latest cycle."""
+        if not opportunities:
+            logger.info("No value opportunities found")
+            return
+        logger.info(f"Found {len(opportunities)} value opportunities")
+        best = heapq.nlargest(
+            5, opportunities, key=operator.attrgetter("expected_value")
+        )
+        for opp in best:
+            logger.info(
+                f"  {opp.selection} @ {opp.odds} ({opp.bookmaker}): "
+                f"EV {opp.expected_value:.3f}"
+            )
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    parser = argparse.ArgumentParser(
+        description="Fantasy probability data pipeline"
+    )
+    parser.add_argument(
+        "--sports", nargs="*", help="Sports to process (default: all)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("update-odds", help="Refresh game and player odds")
+    subparsers.add_parser("collect-data", help="Refresh teams from ESPN")
+    subparsers.add_parser("analyze", help="Report current value opportunities")
+    monitor = subparsers.add_parser("monitor", help="Run the polling loop")
+    monitor.add_argument(
+        "--interval", type=int, default=60, help="Minutes between cycles"
+    )
+    args = parser.parse_args()
+
+    app = FantasyProbabilityApp()
+    if args.command == "update-odds":
+        app.update_odds(args.sports)
+        app.update_player_props(args.sports)
+    elif args.command == "collect-data":
+        app.collect_player_data(args.sports)
+    elif args.command == "analyze":
+        opportunities = app.analyze_fantasy_opportunities(args.sports)
+        opportunities.extend(app.analyze_player_prop_opportunities(args.sports))
+        sys.stdout.write(app.format_opportunities(opportunities))
+    elif args.command == "monitor":
+        asyncio.run(app.start_monitoring(args.interval))
+
+
+if __name__ == "__main__":
+    main()
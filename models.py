@@ -0,0 +1,89 @@
+"""Data models for the fantasy probability calculator."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Team:
+    """A team in one of the supported sports."""
+
+    id: str
+    name: str
+    sport: str
+    conference: Optional[str] = None
+    division: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Player:
+    """A player on a team's roster."""
+
+    id: str
+    name: str
+    team_id: str
+    sport: str
+    position: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Game:
+    """A scheduled or completed game."""
+
+    id: str
+    sport: str
+    home_team: str
+    away_team: str
+    start_time: datetime
+    status: str = "scheduled"
+
+
+# Canonical side codes for an odds selection, assigned once at ingest so
+# analysis code branches on an int instead of re-scanning the selection
+# string per row.
+SIDE_UNKNOWN = -1
+SIDE_HOME = 0
+SIDE_AWAY = 1
+SIDE_OVER = 2
+SIDE_UNDER = 3
+
+
+@dataclass(slots=True, frozen=True)
+class Odds:
+    """A single odds quote from a bookmaker."""
+
+    game_id: str
+    bookmaker: str
+    market_type: str
+    selection: str
+    odds: float
+    timestamp: datetime
+    side: int = SIDE_UNKNOWN
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerProp:
+    """A player performance prop line offered by a bookmaker."""
+
+    game_id: str
+    player_id: str
+    player_name: str
+    prop_type: str
+    line: float
+    over_odds: float
+    under_odds: float
+    bookmaker: str
+    timestamp: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerStats:
+    """Aggregated stats for a player in a given season."""
+
+    player_id: str
+    season: str
+    team_id: str
+    stats: Dict[str, float] = field(default_factory=dict)
+    recent_form: List[bool] = field(default_factory=list)
+    updated_at: Optional[datetime] = None
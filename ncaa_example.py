@@ -0,0 +1,211 @@
+"""Runnable NCAA examples for the fantasy probability calculator."""
+
+import argparse
+import functools
+import logging
+
+import numpy as np
+
+from espn_scraper import ESPNScraper
+from fantasy_calculator import DatabaseManager
+from odds_api import OddsManager
+from probability_calculator import (
+    FantasyProbabilityCalculator,
+    GameContext,
+    TeamStats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# The examples run back to back from main(); constructing a fresh
+# calculator (with its DB connection) or odds manager per example is
+# pure duplicated startup work, so each collaborator is built once on
+# first use and shared.
+@functools.lru_cache(maxsize=1)
+def _db() -> DatabaseManager:
+    return DatabaseManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _prob_calc() -> FantasyProbabilityCalculator:
+    return FantasyProbabilityCalculator(_db())
+
+
+@functools.lru_cache(maxsize=1)
+def _odds_mgr() -> OddsManager:
+    return OddsManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _scraper() -> ESPNScraper:
+    return ESPNScraper()
+
+
+# Sample season-to-date records so the examples run without network
+# access or a populated database.
+NCAAF_TEAMS = {
+    "SEC": [
+        TeamStats("Georgia", 11, 1, 36.2, 16.8, [True, True, True, False, True], [7, 0], [4, 1]),
+        TeamStats("Alabama", 10, 2, 34.1, 18.9, [True, True, False, True, True], [6, 1], [4, 1]),
+    ],
+    "Big Ten": [
+        TeamStats("Michigan", 11, 1, 33.5, 14.2, [True, True, True, True, True], [7, 0], [4, 1]),
+        TeamStats("Ohio State", 10, 2, 35.8, 17.3, [True, False, True, True, True], [6, 1], [4, 1]),
+    ],
+    "Big 12": [
+        TeamStats("Texas", 9, 3, 31.7, 21.4, [True, True, False, True, False], [5, 1], [4, 2]),
+    ],
+}
+
+NCAAM_TEAMS = {
+    "Big East": [
+        TeamStats("UConn", 24, 4, 81.3, 66.1, [True, True, True, True, False], [14, 1], [10, 3]),
+    ],
+    "ACC": [
+        TeamStats("Duke", 22, 6, 79.8, 68.4, [True, False, True, True, True], [13, 2], [9, 4]),
+        TeamStats("North Carolina", 21, 7, 77.5, 70.2, [True, True, False, True, True], [12, 2], [9, 5]),
+    ],
+}
+
+
+def example_ncaa_football_analysis():
+    """Score one NCAAF matchup across all three team markets."""
+    print("=== NCAA Football Analysis ===")
+    calc = _prob_calc()
+    context = GameContext(
+        sport="ncaaf",
+        home_team=NCAAF_TEAMS["SEC"][0],
+        away_team=NCAAF_TEAMS["Big Ten"][1],
+    )
+    # One fused pass shares the strengths and expected scores across
+    # the moneyline and every spread/total line that follows.
+    markets = calc.calculate_team_all(context)
+    print(f"  Home win: {markets['moneyline']['home_win_probability']:.1%}")
+    for spread in (-7.5, -3.5, 2.5):
+        cover = markets["spread_for"](spread)["cover_probability"]
+        print(f"  Cover {spread:+.1f}: {cover:.1%}")
+    for total in (52.5, 56.5):
+        over = markets["total_for"](total)["over_probability"]
+        print(f"  Over {total:.1f}: {over:.1%}")
+
+
+def example_ncaa_basketball_analysis():
+    """Answer every NCAAM market question off one Monte-Carlo pass."""
+    print("=== NCAA Basketball Analysis ===")
+    calc = _prob_calc()
+    context = GameContext(
+        sport="ncaam",
+        home_team=NCAAM_TEAMS["Big East"][0],
+        away_team=NCAAM_TEAMS["ACC"][0],
+    )
+    probs = calc.simulate_game_probabilities(
+        context, spread=-4.5, total=148.5, rng=np.random.default_rng(7)
+    )
+    print(f"  Home win: {probs['home_win_probability']:.1%}")
+    print(f"  Cover -4.5: {probs['cover_probability']:.1%}")
+    print(f"  Over 148.5: {probs['over_probability']:.1%}")
+
+
+@functools.lru_cache(maxsize=64)
+def _conference_strength(league: str, conference: str) -> float:
+    """Average strength of a conference's teams, memoized per name.
+
+    Game analyses hit the same conference many times per week, so
+    repeats are a dict probe.  The sample tables are static; with live
+    season data the cache key would need the season appended.
+    """
+    calc = _prob_calc()
+    tables = NCAAF_TEAMS if league == "ncaaf" else NCAAM_TEAMS
+    teams = tables[conference]
+    return sum(
+        calc._calculate_team_strength(team, league, is_home=True)
+        for team in teams
+    ) / len(teams)
+
+
+def example_conference_strength():
+    """Rank conferences by the average strength of their teams."""
+    print("=== Conference Strength ===")
+    for label, conferences in (("NCAAF", NCAAF_TEAMS), ("NCAAM", NCAAM_TEAMS)):
+        for conference in conferences:
+            strength = _conference_strength(label.lower(), conference)
+            print(f"  {label} {conference}: {strength:.3f}")
+
+
+def _sweep_prop_lines(league: str, prop_type: str, expected: float, lines):
+    """Score a whole array of lines for one player in a single call.
+
+    The fitted mean and variance are computed once and the kernel
+    evaluates every line together, instead of paying a full Python
+    dispatch (and a one-element array) per line.
+    """
+    calc = _prob_calc()
+    lines = np.asarray(lines, dtype=np.float64)
+    variance = calc._calculate_player_variance(league, prop_type, expected)
+    result = calc.calculate_player_prop_probability_batch(
+        np.full(lines.shape, expected), np.full(lines.shape, variance), lines
+    )
+    for line, over, confidence in zip(
+        lines, result["over_probability"], result["confidence"]
+    ):
+        print(f"  Over {line}: {over:.1%} (confidence {confidence:.2f})")
+
+
+def example_ncaa_football_player_props():
+    """Sweep a quarterback's passing-yards lines."""
+    print("=== NCAA Football Player Props ===")
+    # 287.0 = last game's passing yards
+    _sweep_prop_lines(
+        "ncaaf", "passing_yards", 287.0, (250.5, 275.5, 300.5, 325.5)
+    )
+
+
+def example_ncaa_basketball_player_props():
+    """Sweep a guard's points lines."""
+    print("=== NCAA Basketball Player Props ===")
+    # 21.0 = last game's points
+    _sweep_prop_lines("ncaam", "points", 21.0, (15.5, 18.5, 21.5, 24.5))
+
+
+def example_espn_ncaa_scraping():
+    """Rank NCAAF teams by win percentage from ESPN's team feed."""
+    print("=== ESPN NCAA Scraping ===")
+    teams = _scraper().get_teams("ncaaf")
+    print(f"Fetched {len(teams)} teams")
+    for team in sorted(
+        teams, key=lambda t: t["win_percentage"], reverse=True
+    )[:5]:
+        print(f"  {team['name']}: {team['wins']}-{team['losses']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NCAA examples")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass the on-disk odds cache and fetch live responses",
+    )
+    args = parser.parse_args()
+    if args.refresh:
+        for api in _odds_mgr().apis.values():
+            api.use_disk_cache = False
+
+    examples = [
+        example_ncaa_football_analysis,
+        example_ncaa_basketball_analysis,
+        example_conference_strength,
+        example_ncaa_football_player_props,
+        example_ncaa_basketball_player_props,
+        example_espn_ncaa_scraping,
+    ]
+    for example in examples:
+        try:
+            example()
+        except Exception as e:
+            logger.error("Example %s failed: %s", example.__name__, e)
+        print()
+
+
+if __name__ == "__main__":
+    main()
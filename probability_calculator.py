@@ -0,0 +1,1130 @@
+"""Probability models for team markets and player props.
+
+Team markets (moneyline, spread, total) are scored from :class:`TeamStats`
+records; player props pull the player's last game from ESPN and fit a
+normal distribution around the adjusted expectation.
+"""
+
+import asyncio
+import enum
+import functools
+import logging
+import math
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+import numpy as np
+import requests
+from numba import float64, guvectorize, njit, prange
+
+logger = logging.getLogger(__name__)
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Structure-of-arrays layout for a slate of teams: one contiguous record
+# per team so the batch kernel below can walk the slate without touching
+# Python objects.
+TEAM_DTYPE = np.dtype(
+    [
+        ("wins", np.float64),
+        ("losses", np.float64),
+        ("points_for", np.float64),
+        ("points_against", np.float64),
+        ("recent_wins", np.float64),
+        ("recent_games", np.float64),
+        ("venue_wins", np.float64),
+        ("venue_games", np.float64),
+    ]
+)
+
+
+@njit(fastmath=True, cache=True)
+def _strength_scalar(
+    wins, losses, points_for, points_against,
+    recent_wins, recent_games, venue_wins, venue_games, avg_points,
+):
+    games = wins + losses
+    strength = wins / games if games > 0 else 0.5
+    if recent_games > 0:
+        strength = strength * 0.6 + (recent_wins / recent_games) * 0.4
+    if venue_games > 0:
+        strength = strength * 0.7 + (venue_wins / venue_games) * 0.3
+    strength += (points_for - points_against) / avg_points * 0.2
+    return max(0.0, min(1.0, strength))
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _prop_probs_kernel(expected, variances, lines):
+    """Fused z-score / CDF / confidence pass over a prop slate.
+
+    One parallel loop replaces the chain of ufunc calls (and their
+    temporaries); math.erfc keeps the tail accurate for lines far above
+    the expectation.
+    """
+    n = expected.shape[0]
+    over = np.empty(n, np.float64)
+    confidence = np.empty(n, np.float64)
+    for i in prange(n):
+        sd = math.sqrt(variances[i])
+        z = (lines[i] - expected[i]) / sd
+        over[i] = 0.5 * math.erfc(z * _INV_SQRT2)
+        if expected[i] == 0.0:
+            confidence[i] = 0.0
+        else:
+            cv = sd / abs(expected[i])
+            confidence[i] = min(1.0, max(0.0, 1.0 - cv * 0.5))
+    return over, confidence
+
+
+# One game per kernel invocation; the gufunc machinery broadcasts over
+# the slate's leading axis and splits it across cores.  The feature
+# vectors are TEAM_DTYPE rows viewed as float64[8] in field order.
+@guvectorize(
+    [
+        (
+            float64[:], float64[:], float64, float64,
+            float64, float64, float64,
+            float64[:], float64[:], float64[:],
+        )
+    ],
+    "(f),(f),(),(),(),(),()->(),(),()",
+    nopython=True,
+    fastmath=True,
+    target="parallel",
+)
+def _game_probs_kernel(
+    home, away, spread, total, avg_points, home_advantage, variance,
+    win_p, cover_p, over_p,
+):
+    """Fused moneyline/spread/total scoring for one game of a slate."""
+    sqrt_2v2 = math.sqrt(2.0 * variance * variance)
+    sqrt2 = math.sqrt(2.0)
+    hs = _strength_scalar(
+        home[0], home[1], home[2], home[3],
+        home[4], home[5], home[6], home[7], avg_points,
+    )
+    aws = _strength_scalar(
+        away[0], away[1], away[2], away[3],
+        away[4], away[5], away[6], away[7], avg_points,
+    )
+    total_strength = hs + aws
+    if total_strength == 0.0:
+        hw = 0.5
+    else:
+        hw = hs / total_strength + (home_advantage / avg_points) * 0.5
+    win_p[0] = max(0.05, min(0.95, hw))
+
+    home_expected = (home[2] + away[3]) / 2.0 + home_advantage
+    away_expected = (away[2] + home[3]) / 2.0
+    margin = home_expected - away_expected
+    z_spread = (margin + spread) / sqrt_2v2
+    cover_p[0] = 0.5 * (1.0 + math.erf(z_spread / sqrt2))
+    z_total = (total - (home_expected + away_expected)) / sqrt_2v2
+    over_p[0] = 1.0 - 0.5 * (1.0 + math.erf(z_total / sqrt2))
+
+
+def team_stats_to_array(teams: List["TeamStats"], is_home: bool) -> np.ndarray:
+    """Pack TeamStats records into the SoA layout the batch kernel reads."""
+    arr = np.zeros(len(teams), dtype=TEAM_DTYPE)
+    for i, team in enumerate(teams):
+        record = team.home_record if is_home else team.away_record
+        arr[i] = (
+            team.wins,
+            team.losses,
+            team.points_for,
+            team.points_against,
+            float(team.recent_wins),
+            float(team.recent_games),
+            float(record[0]) if record else 0.0,
+            float(team.home_games if is_home else team.away_games),
+        )
+    return arr
+
+
+class TeamStatsTable:
+    """Structure-of-arrays view over a slate's team records.
+
+    Wraps one TEAM_DTYPE array and exposes the columns plus a
+    vectorized strength computation, so league-wide passes work on
+    contiguous arrays instead of walking per-team Python objects.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+
+    @classmethod
+    def from_teamstats(
+        cls, teams: List["TeamStats"], is_home: bool
+    ) -> "TeamStatsTable":
+        return cls(team_stats_to_array(teams, is_home))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name in TEAM_DTYPE.names:
+            return self.data[name]
+        raise AttributeError(name)
+
+    def as_kernel_input(self) -> np.ndarray:
+        """The rows viewed as float64[8] in field order for the gufunc."""
+        return self.data.view(np.float64).reshape(len(self.data), -1)
+
+    def strength(self, avg_points: float) -> np.ndarray:
+        """Vectorized strength blend as one row-wise dot product.
+
+        The sequential weighted averages fold into per-row weights on a
+        (teams x factors) matrix: rows without recent form or venue
+        splits get those columns zeroed with the remaining weights
+        scaled exactly as the scalar blend would, and the whole slate
+        reduces in a single einsum contraction plus a clip.
+        """
+        d = self.data
+        games = d["wins"] + d["losses"]
+        win_pct = np.where(games > 0, d["wins"] / np.maximum(games, 1.0), 0.5)
+        recent_pct = d["recent_wins"] / np.maximum(d["recent_games"], 1.0)
+        venue_pct = d["venue_wins"] / np.maximum(d["venue_games"], 1.0)
+        diff = (d["points_for"] - d["points_against"]) / avg_points
+
+        has_recent = d["recent_games"] > 0
+        has_venue = d["venue_games"] > 0
+        venue_scale = np.where(has_venue, 0.7, 1.0)
+        factors = np.stack([win_pct, recent_pct, venue_pct, diff], axis=1)
+        weights = np.stack(
+            [
+                np.where(has_recent, 0.6, 1.0) * venue_scale,
+                np.where(has_recent, 0.4, 0.0) * venue_scale,
+                np.where(has_venue, 0.3, 0.0),
+                np.full(len(d), 0.2),
+            ],
+            axis=1,
+        )
+        return np.clip(np.einsum("nf,nf->n", factors, weights), 0.0, 1.0)
+
+
+class League(enum.IntEnum):
+    """Integer ids for the supported leagues.
+
+    Hot lookup tables are keyed by these instead of strings: a probe by
+    small int skips string hashing, which adds up at millions of prop
+    scores.  Strings convert once at the API boundary via LEAGUE_IDS.
+    """
+
+    NFL = 0
+    NBA = 1
+    MLB = 2
+    NHL = 3
+    NCAAF = 4
+    NCAAM = 5
+
+
+class PropType(enum.IntEnum):
+    """Integer ids for the supported prop types (see :class:`League`)."""
+
+    PASSING_YARDS = 0
+    PASSING_TDS = 1
+    RUSHING_YARDS = 2
+    RECEIVING_YARDS = 3
+    RECEPTIONS = 4
+    POINTS = 5
+    REBOUNDS = 6
+    ASSISTS = 7
+    THREE_POINTERS = 8
+    GOALS = 9
+    SHOTS_ON_GOAL = 10
+    HITS = 11
+    TOTAL_BASES = 12
+    RUNS = 13
+    RBIS = 14
+
+
+LEAGUE_IDS = {league.name.lower(): league for league in League}
+PROP_TYPE_IDS = {prop.name.lower(): prop for prop in PropType}
+
+ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
+
+ESPN_LEAGUE_PATHS = {
+    "nfl": "football/nfl",
+    "nba": "basketball/nba",
+    "mlb": "baseball/mlb",
+    "nhl": "hockey/nhl",
+    "ncaaf": "football/college-football",
+    "ncaam": "basketball/mens-college-basketball",
+}
+
+
+@dataclass(slots=True)
+class TeamStats:
+    """Season-to-date numbers for one team."""
+
+    team_name: str
+    wins: int
+    losses: int
+    points_for: float
+    points_against: float
+    recent_form: List[bool] = field(default_factory=list)
+    home_record: List[int] = field(default_factory=list)
+    away_record: List[int] = field(default_factory=list)
+    # Derived counters, fixed once at construction.  The strength math
+    # reads these every call, and summing the underlying lists there
+    # turned a constant-time blend into repeated O(n) scans.
+    recent_wins: int = field(init=False, repr=False, default=0)
+    recent_games: int = field(init=False, repr=False, default=0)
+    home_games: int = field(init=False, repr=False, default=0)
+    away_games: int = field(init=False, repr=False, default=0)
+    recent_form_winrate: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self):
+        self.recent_wins = int(sum(self.recent_form))
+        self.recent_games = len(self.recent_form)
+        self.home_games = int(sum(self.home_record)) if self.home_record else 0
+        self.away_games = int(sum(self.away_record)) if self.away_record else 0
+        if self.recent_games:
+            self.recent_form_winrate = self.recent_wins / self.recent_games
+
+
+@dataclass(slots=True)
+class PlayerGameStats:
+    """A player's box score from a single game."""
+
+    player_name: str
+    team: str
+    league: str
+    game_date: Optional[datetime]
+    opponent: Optional[str]
+    stats: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class GameContext:
+    """Everything the team-market models need about one matchup."""
+
+    sport: str
+    home_team: TeamStats
+    away_team: TeamStats
+    game_date: Optional[datetime] = None
+    # Joint (home, away) score draws, filled by simulate_game so later
+    # market questions against the same context are pure reductions.
+    _sim_scores: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+
+class FantasyProbabilityCalculator:
+    """Computes true probabilities for team markets and player props."""
+
+    SPORT_STATS = {
+        "nfl": {"avg_points": 22.5, "home_advantage": 2.5, "variance": 10.0},
+        "nba": {"avg_points": 112.0, "home_advantage": 3.0, "variance": 12.0},
+        "mlb": {"avg_points": 4.5, "home_advantage": 0.2, "variance": 3.0},
+        "nhl": {"avg_points": 3.0, "home_advantage": 0.25, "variance": 1.8},
+        "ncaaf": {"avg_points": 28.0, "home_advantage": 3.5, "variance": 14.0},
+        "ncaam": {"avg_points": 72.0, "home_advantage": 3.5, "variance": 11.0},
+    }
+
+    PLAYER_PROP_MAPPINGS = {
+        "nfl": {
+            "passing_yards": ["passingYards", "passing_yards", "YDS"],
+            "passing_tds": ["passingTouchdowns", "passing_tds", "TD"],
+            "rushing_yards": ["rushingYards", "rushing_yards", "YDS"],
+            "receiving_yards": ["receivingYards", "receiving_yards", "YDS"],
+            "receptions": ["receptions", "REC"],
+        },
+        "nba": {
+            "points": ["points", "PTS"],
+            "rebounds": ["totalRebounds", "rebounds", "REB"],
+            "assists": ["assists", "AST"],
+            "three_pointers": ["threePointFieldGoalsMade", "3PM"],
+        },
+        "nhl": {
+            "points": ["points", "PTS"],
+            "goals": ["goals", "G"],
+            "assists": ["assists", "A"],
+            "shots_on_goal": ["shotsTotal", "SOG"],
+        },
+        "mlb": {
+            "hits": ["hits", "H"],
+            "total_bases": ["totalBases", "TB"],
+            "runs": ["runs", "R"],
+            "rbis": ["RBIs", "RBI"],
+        },
+    }
+
+    def __init__(self, db_manager=None):
+        self.db_manager = db_manager
+        # Per-instance cache (lru_cache on the method itself would key on
+        # self and pin the instance): several props for the same player,
+        # or several players on the same team, share one scoreboard pull.
+        self.find_latest_team_game_event = functools.lru_cache(maxsize=256)(
+            self._fetch_latest_team_game_event
+        )
+        self._player_last_game_cached = functools.lru_cache(maxsize=4096)(
+            self._fetch_player_last_game_stats
+        )
+        # Stale-while-revalidate store for ESPN payloads: entries under
+        # the fresh TTL are served directly, entries between the fresh
+        # and stale TTLs are served immediately while a background
+        # worker refreshes them, and only entries past the stale TTL
+        # block on the network.
+        self._swr_cache: Dict[str, Tuple[float, object]] = {}
+        self._swr_refreshing: set = set()
+        self._swr_lock = threading.Lock()
+        self._swr_executor = ThreadPoolExecutor(max_workers=4)
+        # Uppercased variant tuples, built once per instance: the old
+        # per-call loop uppercased every variant against every stat key,
+        # which added up over thousands of props per scan.
+        self._prop_exact = {
+            (LEAGUE_IDS[league], PROP_TYPE_IDS[prop_type]): tuple(variants)
+            for league, mapping in self.PLAYER_PROP_MAPPINGS.items()
+            for prop_type, variants in mapping.items()
+        }
+        self._prop_upper = {
+            key: tuple(k.upper() for k in variants)
+            for key, variants in self._prop_exact.items()
+        }
+        self._matchup_coeffs_by_id = {
+            (LEAGUE_IDS[league], PROP_TYPE_IDS[prop_type]): coeffs
+            for (league, prop_type), coeffs in self._MATCHUP_COEFFS.items()
+        }
+        # Derived per-sport constants, computed once: the market methods
+        # otherwise repeat the SPORT_STATS lookup and recompute
+        # sqrt(2 * variance^2) on every call.
+        self._sport_derived = {
+            sport: types.SimpleNamespace(
+                avg_points=v["avg_points"],
+                home_advantage=v["home_advantage"],
+                variance=v["variance"],
+                sqrt_2var_sq=math.sqrt(2.0 * v["variance"] ** 2),
+            )
+            for sport, v in self.SPORT_STATS.items()
+        }
+
+    # --- ESPN helpers --------------------------------------------------
+
+    @staticmethod
+    def _scoreboard_url(league: str) -> str:
+        path = ESPN_LEAGUE_PATHS.get(league)
+        if path is None:
+            raise ValueError(f"Unsupported league: {league}")
+        return f"{ESPN_BASE_URL}/{path}/scoreboard"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_espn_date(date_str: str) -> Optional[datetime]:
+        """Parse ESPN's ISO-8601 timestamps, memoized per string.
+
+        Every prop on a game re-parses the same event date, and the
+        Zulu-suffix replace allocates a fresh string each time; the
+        cache turns repeats into a dict hit.
+        """
+        if date_str.endswith("Z"):
+            date_str = date_str[:-1] + "+00:00"
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _pick_latest_completed_event(
+        data: Dict, team_query: str
+    ) -> Optional[Dict]:
+        """Select a team's most recent completed game from a scoreboard."""
+        query = team_query.lower()
+        latest = None
+        latest_date = None
+        for event in data.get("events", []):
+            names = event.get("name", "").lower()
+            if query not in names:
+                continue
+            status = (
+                (event.get("competitions") or [{}])[0]
+                .get("status", {})
+                .get("type", {})
+            )
+            if not status.get("completed"):
+                continue
+            event_date = FantasyProbabilityCalculator._parse_espn_date(
+                event["date"]
+            )
+            if event_date is None:
+                continue
+            if latest_date is None or event_date > latest_date:
+                latest = event
+                latest_date = event_date
+        return latest
+
+    def _fetch_latest_team_game_event(
+        self, league: str, team_query: str
+    ) -> Optional[Dict]:
+        """Find the most recent completed game for a team on the scoreboard."""
+        response = requests.get(self._scoreboard_url(league), timeout=10)
+        response.raise_for_status()
+        return self._pick_latest_completed_event(response.json(), team_query)
+
+    async def _find_latest_team_game_event_async(
+        self, session: aiohttp.ClientSession, league: str, team_query: str
+    ) -> Optional[Dict]:
+        """Async variant of :meth:`find_latest_team_game_event`."""
+        async with session.get(
+            self._scoreboard_url(league),
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return self._pick_latest_completed_event(data, team_query)
+
+    def fetch_game_summary(self, league: str, event_id: str) -> Dict:
+        """Box-score summary for one game, served stale-while-revalidate."""
+        return self._swr_get(
+            f"summary:{league}:{event_id}",
+            lambda: self._fetch_game_summary(league, event_id),
+        )
+
+    def _fetch_game_summary(self, league: str, event_id: str) -> Dict:
+        path = ESPN_LEAGUE_PATHS[league]
+        url = f"{ESPN_BASE_URL}/{path}/summary"
+        response = requests.get(url, params={"event": event_id}, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    async def _fetch_game_summary_async(
+        self, session: aiohttp.ClientSession, league: str, event_id: str
+    ) -> Dict:
+        """Async summary fetch sharing the SWR store with the sync path."""
+        key = f"summary:{league}:{event_id}"
+        with self._swr_lock:
+            entry = self._swr_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < 1800.0:
+            return entry[1]
+        path = ESPN_LEAGUE_PATHS[league]
+        url = f"{ESPN_BASE_URL}/{path}/summary"
+        async with session.get(
+            url,
+            params={"event": event_id},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        with self._swr_lock:
+            self._swr_cache[key] = (time.monotonic(), data)
+        return data
+
+    def _swr_get(
+        self,
+        key: str,
+        loader,
+        fresh_ttl: float = 300.0,
+        stale_ttl: float = 1800.0,
+    ):
+        """Serve ``key`` from the SWR cache, refreshing as needed."""
+        now = time.monotonic()
+        with self._swr_lock:
+            entry = self._swr_cache.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            age = now - fetched_at
+            if age < fresh_ttl:
+                logger.debug("%s served fresh (age %.0fs)", key, age)
+                return value
+            if age < stale_ttl:
+                logger.debug("%s served stale (age %.0fs), refreshing", key, age)
+                self._swr_refresh(key, loader)
+                return value
+        value = loader()
+        with self._swr_lock:
+            self._swr_cache[key] = (time.monotonic(), value)
+        return value
+
+    def _swr_refresh(self, key: str, loader) -> None:
+        """Refresh one cache entry in the background, deduplicated."""
+        with self._swr_lock:
+            if key in self._swr_refreshing:
+                return
+            self._swr_refreshing.add(key)
+
+        def refresh():
+            try:
+                value = loader()
+                with self._swr_lock:
+                    self._swr_cache[key] = (time.monotonic(), value)
+            except Exception as e:
+                logger.error("Background refresh of %s failed: %s", key, e)
+            finally:
+                with self._swr_lock:
+                    self._swr_refreshing.discard(key)
+
+        self._swr_executor.submit(refresh)
+
+    def get_player_last_game_stats(
+        self, league: str, team_query: str, player_name: str
+    ) -> Optional[PlayerGameStats]:
+        """Return a player's stat line from their team's latest game.
+
+        Memoized per (league, team, player, day): every prop for a
+        player otherwise repeats the same scoreboard and summary fetch,
+        and the day in the key lets a long-lived monitor pick up fresh
+        games without restarting.
+        """
+        return self._player_last_game_cached(
+            league,
+            team_query.lower(),
+            player_name.lower(),
+            date.today().isoformat(),
+        )
+
+    def _fetch_player_last_game_stats(
+        self, league: str, team_query: str, player_name: str, day: str
+    ) -> Optional[PlayerGameStats]:
+        # ``day`` scopes both the in-memory entry and the SQLite row, so
+        # short-lived CLI runs on the same slate skip ESPN entirely.
+        if self.db_manager is not None:
+            cached = self.db_manager.get_cached_player_last_game(
+                league, team_query, player_name, day
+            )
+            if cached is not None:
+                return self._stats_from_payload(cached[0])
+        event = self.find_latest_team_game_event(league, team_query)
+        if event is None:
+            stats = None
+        else:
+            summary = self.fetch_game_summary(league, event["id"])
+            stats = self._player_from_summary(
+                league, event, summary, player_name
+            )
+        if self.db_manager is not None:
+            self.db_manager.store_cached_player_last_game(
+                league,
+                team_query,
+                player_name,
+                day,
+                self._stats_to_payload(stats),
+            )
+        return stats
+
+    @staticmethod
+    def _stats_to_payload(stats: Optional[PlayerGameStats]) -> Optional[Dict]:
+        if stats is None:
+            return None
+        payload = asdict(stats)
+        payload["game_date"] = stats.game_date.isoformat()
+        return payload
+
+    @staticmethod
+    def _stats_from_payload(
+        payload: Optional[Dict],
+    ) -> Optional[PlayerGameStats]:
+        if payload is None:
+            return None
+        payload = dict(payload)
+        payload["game_date"] = datetime.fromisoformat(payload["game_date"])
+        return PlayerGameStats(**payload)
+
+    async def get_player_last_game_stats_async(
+        self,
+        session: aiohttp.ClientSession,
+        league: str,
+        team_query: str,
+        player_name: str,
+    ) -> Optional[PlayerGameStats]:
+        """Async variant of :meth:`get_player_last_game_stats`."""
+        event = await self._find_latest_team_game_event_async(
+            session, league, team_query
+        )
+        if event is None:
+            return None
+        summary = await self._fetch_game_summary_async(
+            session, league, event["id"]
+        )
+        return self._player_from_summary(league, event, summary, player_name)
+
+    @staticmethod
+    def _player_from_summary(
+        league: str, event: Dict, summary: Dict, player_name: str
+    ) -> Optional[PlayerGameStats]:
+        """Pull one player's stat line out of a box-score summary."""
+        query = player_name.lower()
+        for team_block in summary.get("boxscore", {}).get("players", []):
+            for stat_group in team_block.get("statistics", []):
+                labels = stat_group.get("labels", [])
+                for athlete in stat_group.get("athletes", []):
+                    name = athlete.get("athlete", {}).get("displayName", "")
+                    if query not in name.lower():
+                        continue
+                    values = athlete.get("stats", [])
+                    stats = {}
+                    for label, value in zip(labels, values):
+                        try:
+                            stats[label] = float(value)
+                        except (TypeError, ValueError):
+                            continue
+                    return PlayerGameStats(
+                        player_name=name,
+                        team=team_block.get("team", {}).get("displayName", ""),
+                        league=league,
+                        game_date=FantasyProbabilityCalculator._parse_espn_date(
+                            event["date"]
+                        ),
+                        opponent=None,
+                        stats=stats,
+                    )
+        return None
+
+    def clear_cache(self) -> None:
+        """Drop memoized ESPN lookups so the next pass refetches."""
+        self.find_latest_team_game_event.cache_clear()
+        self._player_last_game_cached.cache_clear()
+
+    def _extract_stat_value(
+        self, league: str, prop_type: str, stats: Dict[str, float]
+    ) -> Optional[float]:
+        """Find the stat matching a prop type among ESPN's label variants."""
+        league_id = LEAGUE_IDS.get(league)
+        prop_id = PROP_TYPE_IDS.get(prop_type)
+        if league_id is None or prop_id is None:
+            return None
+        exact_variants = self._prop_exact.get((league_id, prop_id))
+        if exact_variants is None:
+            return None
+        # Cheap common case first: a variant present under its exact
+        # spelling is a plain dict hit.
+        for variant in exact_variants:
+            if variant in stats:
+                value = stats[variant]
+                break
+        else:
+            # Build one uppercased view of the stats and probe it per
+            # variant, instead of re-uppercasing every key per variant.
+            upper_stats = {k.upper(): v for k, v in stats.items()}
+            for variant in self._prop_upper[(league_id, prop_id)]:
+                if variant in upper_stats:
+                    value = upper_stats[variant]
+                    break
+            else:
+                return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    # --- player props --------------------------------------------------
+
+    def calculate_player_prop_probability(
+        self,
+        league: str,
+        team_query: str,
+        player_name: str,
+        prop_type: str,
+        line: float,
+        game_context: Optional[GameContext] = None,
+    ) -> Dict:
+        """Estimate over/under probabilities for a player prop line."""
+        player_stats = self.get_player_last_game_stats(
+            league, team_query, player_name
+        )
+        return self._score_prop(league, prop_type, line, game_context, player_stats)
+
+    async def calculate_player_prop_probabilities_batch(
+        self, specs: List[Dict], max_concurrency: int = 16
+    ) -> List[Optional[Dict]]:
+        """Score many props concurrently; the workload is network-bound.
+
+        Each spec is a dict with ``league``, ``team_query``,
+        ``player_name``, ``prop_type``, ``line`` and optionally
+        ``game_context``.  The ESPN fetches share one aiohttp session
+        bounded by a semaphore, so a slate's wall time is roughly the
+        slowest request times ceil(N / concurrency) rather than the sum
+        of all latencies.  Failed specs come back as None.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with aiohttp.ClientSession() as session:
+
+            async def score(spec: Dict) -> Dict:
+                async with semaphore:
+                    player_stats = await self.get_player_last_game_stats_async(
+                        session,
+                        spec["league"],
+                        spec["team_query"],
+                        spec["player_name"],
+                    )
+                return self._score_prop(
+                    spec["league"],
+                    spec["prop_type"],
+                    spec["line"],
+                    spec.get("game_context"),
+                    player_stats,
+                )
+
+            results = await asyncio.gather(
+                *(score(spec) for spec in specs), return_exceptions=True
+            )
+        return [r if not isinstance(r, BaseException) else None for r in results]
+
+    def calculate_player_prop_probabilities(
+        self, specs: List[Dict], max_concurrency: int = 16
+    ) -> List[Optional[Dict]]:
+        """Sync entry point for the concurrent batch scorer."""
+        return asyncio.run(
+            self.calculate_player_prop_probabilities_batch(
+                specs, max_concurrency=max_concurrency
+            )
+        )
+
+    def _score_prop(
+        self,
+        league: str,
+        prop_type: str,
+        line: float,
+        game_context: Optional[GameContext],
+        player_stats: Optional[PlayerGameStats],
+    ) -> Dict:
+        """Shared post-fetch scoring for the scalar and batch paths."""
+        if player_stats is None:
+            return {
+                "over_probability": 0.5,
+                "under_probability": 0.5,
+                "expected_value": line,
+                "confidence": 0.0,
+                "last_game_value": None,
+            }
+
+        stat_value = self._extract_stat_value(league, prop_type, player_stats.stats)
+        if not stat_value:
+            # Missing or zero stat lines (a player who sat out, or a
+            # prop the box score does not carry) would only produce a
+            # garbage z-score; return the neutral result the no-stats
+            # path uses and skip the variance/matchup/CDF work.
+            return {
+                "over_probability": 0.5,
+                "under_probability": 0.5,
+                "expected_value": line,
+                "confidence": 0.0,
+                "last_game_value": stat_value,
+            }
+
+        expected = stat_value
+        if game_context is not None:
+            expected += self._calculate_matchup_adjustment(
+                league, prop_type, game_context.away_team
+            )
+
+        variance = self._calculate_player_variance(league, prop_type, expected)
+        z = (line - expected) / math.sqrt(variance)
+        # erfc keeps the tail accurate when the line sits far above the
+        # expectation, where 1 - cdf(z) would cancel.
+        over_probability = 0.5 * math.erfc(z * _INV_SQRT2)
+        under_probability = 1.0 - over_probability
+        confidence = self._calculate_player_confidence(expected, variance)
+
+        return {
+            "over_probability": over_probability,
+            "under_probability": under_probability,
+            "expected_value": expected,
+            "confidence": confidence,
+            "last_game_value": stat_value,
+        }
+
+    def calculate_player_prop_probability_batch(
+        self,
+        expected: np.ndarray,
+        variances: np.ndarray,
+        lines: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Over/under probabilities for many prop lines in one pass.
+
+        The numeric work runs in one parallel numba kernel instead of
+        an interpreter round-trip per prop; the scalar
+        :meth:`calculate_player_prop_probability` keeps the
+        fetch-and-adjust plumbing and shares the same erfc formulation.
+        """
+        over, confidence = _prop_probs_kernel(
+            np.asarray(expected, dtype=np.float64),
+            np.asarray(variances, dtype=np.float64),
+            np.asarray(lines, dtype=np.float64),
+        )
+        return {
+            "over_probability": over,
+            "under_probability": 1.0 - over,
+            "confidence": confidence,
+        }
+
+    def _normal_cdf(self, x: float) -> float:
+        """Standard normal CDF via scipy's C implementation.
+
+        scipy is imported here rather than at module top: this is its
+        only remaining call site and the import costs real cold-start
+        time for CLI paths that never score a market.
+        """
+        from scipy.special import ndtr
+
+        return float(ndtr(x))
+
+    def _calculate_player_variance(
+        self, league: str, prop_type: str, expected: float
+    ) -> float:
+        """Rough variance model: spread scales with the expectation."""
+        base = max(abs(expected), 1.0)
+        if prop_type in ("passing_yards", "rushing_yards", "receiving_yards"):
+            return (base * 0.35) ** 2
+        if prop_type in ("points", "total_bases"):
+            return (base * 0.4) ** 2
+        return (base * 0.5) ** 2
+
+    def _calculate_player_confidence(self, expected: float, variance: float) -> float:
+        """Confidence falls as the coefficient of variation rises."""
+        if expected == 0:
+            return 0.0
+        cv = math.sqrt(variance) / abs(expected)
+        return float(max(0.0, min(1.0, 1.0 - cv * 0.5)))
+
+    # (coef_against, coef_diff) per (league, prop_type): the adjustment
+    # is always coef_against * points_against + coef_diff * point diff,
+    # so the old if/elif cascade was data disguised as code.
+    _MATCHUP_COEFFS = {
+        ("nfl", "passing_yards"): (-0.05, 0.0),
+        ("nfl", "rushing_yards"): (-0.03, 0.0),
+        ("nfl", "receiving_yards"): (-0.04, 0.0),
+        ("nba", "points"): (-0.02, 0.0),
+        ("nba", "rebounds"): (0.0, 0.01),
+        ("nba", "assists"): (0.0, 0.005),
+        ("nhl", "shots_on_goal"): (-0.02, 0.0),
+    }
+
+    def _calculate_matchup_adjustment(
+        self, league: str, prop_type: str, opponent: TeamStats
+    ) -> float:
+        """Shift the expectation based on the opposing defense."""
+        coef_against, coef_diff = self._matchup_coeffs_by_id.get(
+            (LEAGUE_IDS.get(league), PROP_TYPE_IDS.get(prop_type)),
+            (0.0, 0.0),
+        )
+        return coef_against * opponent.points_against + coef_diff * (
+            opponent.points_for - opponent.points_against
+        )
+
+    # --- team markets --------------------------------------------------
+
+    def _sport_info(self, sport: str) -> types.SimpleNamespace:
+        return self._sport_derived.get(sport, self._sport_derived["nfl"])
+
+    def _calculate_team_strength(
+        self, team_stats: TeamStats, sport: str, is_home: bool
+    ) -> float:
+        """Blend season record, recent form and venue splits into [0, 1]."""
+        games = team_stats.wins + team_stats.losses
+        strength = team_stats.wins / games if games else 0.5
+
+        if team_stats.recent_games > 0:
+            strength = strength * 0.6 + team_stats.recent_form_winrate * 0.4
+
+        if is_home:
+            record, venue_games = team_stats.home_record, team_stats.home_games
+        else:
+            record, venue_games = team_stats.away_record, team_stats.away_games
+        if venue_games > 0:
+            venue_pct = record[0] / venue_games
+            strength = strength * 0.7 + venue_pct * 0.3
+
+        sport_info = self._sport_info(sport)
+        point_diff = team_stats.points_for - team_stats.points_against
+        normalized_diff = point_diff / sport_info.avg_points
+        strength += normalized_diff * 0.2
+
+        return max(0.0, min(1.0, strength))
+
+    def _calculate_confidence(
+        self, home_stats: TeamStats, away_stats: TeamStats
+    ) -> float:
+        """More games played means more confidence in the numbers."""
+        home_games = home_stats.wins + home_stats.losses
+        away_games = away_stats.wins + away_stats.losses
+        sample = min(home_games, away_games)
+        return float(max(0.1, min(1.0, sample / 20.0)))
+
+    def calculate_team_all(self, game_context: GameContext) -> Dict:
+        """Score every team market for one game off shared intermediates.
+
+        The strengths, expected scores and confidence are computed once;
+        the returned ``spread_for``/``total_for`` callables close over
+        them, so pricing several lines of the same game only pays the
+        per-line normal CDF.
+        """
+        sport_info = self._sport_info(game_context.sport)
+        home = game_context.home_team
+        away = game_context.away_team
+
+        home_strength = self._calculate_team_strength(
+            home, game_context.sport, is_home=True
+        )
+        away_strength = self._calculate_team_strength(
+            away, game_context.sport, is_home=False
+        )
+        home_advantage = sport_info.home_advantage / sport_info.avg_points
+        total = home_strength + away_strength
+        if total == 0:
+            home_win = 0.5
+        else:
+            home_win = home_strength / total + home_advantage * 0.5
+        home_win = max(0.05, min(0.95, home_win))
+
+        home_expected = (
+            home.points_for + away.points_against
+        ) / 2.0 + sport_info.home_advantage
+        away_expected = (away.points_for + home.points_against) / 2.0
+        margin = home_expected - away_expected
+        expected_total = home_expected + away_expected
+        sqrt_2var_sq = sport_info.sqrt_2var_sq
+        confidence = self._calculate_confidence(home, away)
+
+        def spread_for(spread: float) -> Dict:
+            z = (margin + spread) / sqrt_2var_sq
+            return {
+                "cover_probability": self._normal_cdf(z),
+                "expected_margin": margin,
+                "confidence": confidence,
+            }
+
+        def total_for(total_line: float) -> Dict:
+            z = (total_line - expected_total) / sqrt_2var_sq
+            under_probability = self._normal_cdf(z)
+            return {
+                "over_probability": 1.0 - under_probability,
+                "under_probability": under_probability,
+                "expected_total": expected_total,
+                "confidence": confidence,
+            }
+
+        return {
+            "moneyline": {
+                "home_win_probability": home_win,
+                "away_win_probability": 1.0 - home_win,
+                "confidence": confidence,
+            },
+            "spread_for": spread_for,
+            "total_for": total_for,
+        }
+
+    def calculate_team_moneyline_probability(self, game_context: GameContext) -> Dict:
+        """Estimate home/away win probabilities for a game."""
+        return self.calculate_team_all(game_context)["moneyline"]
+
+    def calculate_game_probabilities_batch(
+        self,
+        game_contexts: List[GameContext],
+        spreads: List[float],
+        totals: List[float],
+    ) -> Dict[str, np.ndarray]:
+        """Score a whole slate of one sport's games in one fused pass.
+
+        Packs both sides of every game into SoA arrays and runs the
+        moneyline, spread and total math in a single parallel kernel, so
+        per-game Python dispatch disappears for slate-sized inputs.
+        """
+        sport = game_contexts[0].sport
+        sport_info = self._sport_info(sport)
+        home = TeamStatsTable.from_teamstats(
+            [ctx.home_team for ctx in game_contexts], is_home=True
+        )
+        away = TeamStatsTable.from_teamstats(
+            [ctx.away_team for ctx in game_contexts], is_home=False
+        )
+        # fastmath speculates the guarded divisions (venue/recent records
+        # with zero games), raising the FP invalid flag even though the
+        # guards discard those lanes; mute it so every slate pass does
+        # not print a spurious RuntimeWarning.
+        with np.errstate(invalid="ignore"):
+            win_p, cover_p, over_p = _game_probs_kernel(
+                home.as_kernel_input(),
+                away.as_kernel_input(),
+                np.asarray(spreads, dtype=np.float64),
+                np.asarray(totals, dtype=np.float64),
+                sport_info.avg_points,
+                sport_info.home_advantage,
+                sport_info.variance,
+            )
+        return {
+            "home_win_probability": win_p,
+            "away_win_probability": 1.0 - win_p,
+            "cover_probability": cover_p,
+            "over_probability": over_p,
+            "under_probability": 1.0 - over_p,
+        }
+
+    def simulate_game(
+        self,
+        game_context: GameContext,
+        n: int = 100_000,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample joint (home, away) score draws for one game.
+
+        The draws are cached on the context, so every market question
+        that follows - moneyline, any spread, any total - is a single
+        boolean reduction over arrays that already exist.
+        """
+        cached = game_context._sim_scores
+        if cached is not None and cached[0].shape[0] == n:
+            return cached
+
+        sport_info = self._sport_info(game_context.sport)
+        home = game_context.home_team
+        away = game_context.away_team
+        home_expected = (
+            home.points_for + away.points_against
+        ) / 2.0 + sport_info.home_advantage
+        away_expected = (away.points_for + home.points_against) / 2.0
+        if rng is None:
+            rng = np.random.default_rng()
+        scores = (
+            rng.normal(home_expected, sport_info.variance, n),
+            rng.normal(away_expected, sport_info.variance, n),
+        )
+        game_context._sim_scores = scores
+        return scores
+
+    def simulate_game_probabilities(
+        self,
+        game_context: GameContext,
+        spread: Optional[float] = None,
+        total: Optional[float] = None,
+        n: int = 100_000,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict:
+        """Answer all of a game's market questions off one simulation."""
+        home, away = self.simulate_game(game_context, n, rng)
+        home_win = float((home > away).mean())
+        result = {
+            "home_win_probability": home_win,
+            "away_win_probability": 1.0 - home_win,
+            "confidence": self._calculate_confidence(
+                game_context.home_team, game_context.away_team
+            ),
+        }
+        if spread is not None:
+            result["cover_probability"] = float(
+                ((home - away + spread) > 0).mean()
+            )
+        if total is not None:
+            over = float(((home + away) > total).mean())
+            result["over_probability"] = over
+            result["under_probability"] = 1.0 - over
+        return result
+
+    def calculate_team_spread_probability(
+        self, game_context: GameContext, spread: float
+    ) -> Dict:
+        """Estimate the probability the home team covers ``spread``."""
+        return self.calculate_team_all(game_context)["spread_for"](spread)
+
+    def calculate_team_total_probability(
+        self, game_context: GameContext, total: float
+    ) -> Dict:
+        """Estimate over/under probabilities for the game total."""
+        return self.calculate_team_all(game_context)["total_for"](total)
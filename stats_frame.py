@@ -0,0 +1,82 @@
+"""Structure-of-arrays view over batches of PlayerStats records.
+
+Lives apart from models.py so that importing the models (which
+fantasy_main does eagerly for every subcommand, including --help) does
+not pull in NumPy; the frame is only needed by bulk statistical passes
+that already pay for it.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from models import PlayerStats
+
+
+class PlayerStatsFrame:
+    """Structure-of-arrays view over a batch of PlayerStats records.
+
+    Bulk statistical passes (season averages across a slate, recent-form
+    winrates) otherwise walk Python objects pulling one float at a time;
+    the frame exposes whole columns as NumPy arrays so they reduce in a
+    single vectorized op.  Stat columns are materialized lazily per key
+    because the underlying dicts are sparse across positions.
+    """
+
+    __slots__ = (
+        "player_ids",
+        "seasons",
+        "team_ids",
+        "recent_form",
+        "recent_games",
+        "_records",
+        "_columns",
+    )
+
+    def __init__(self, records: List[PlayerStats]):
+        self._records = list(records)
+        self._columns: Dict[str, np.ndarray] = {}
+        n = len(self._records)
+        self.player_ids = np.array(
+            [r.player_id for r in self._records], dtype=object
+        )
+        self.seasons = np.array(
+            [r.season for r in self._records], dtype=object
+        )
+        self.team_ids = np.array(
+            [r.team_id for r in self._records], dtype=object
+        )
+        width = max((len(r.recent_form) for r in self._records), default=0)
+        self.recent_form = np.zeros((n, width), dtype=np.float32)
+        self.recent_games = np.zeros(n, dtype=np.int64)
+        for i, record in enumerate(self._records):
+            form = record.recent_form
+            self.recent_form[i, : len(form)] = form
+            self.recent_games[i] = len(form)
+
+    @classmethod
+    def from_records(cls, records: List[PlayerStats]) -> "PlayerStatsFrame":
+        return cls(records)
+
+    def to_records(self) -> List[PlayerStats]:
+        return list(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def stat_array(self, name: str, default: float = 0.0) -> np.ndarray:
+        """One stat as a float64 column, ``default`` where absent."""
+        column = self._columns.get(name)
+        if column is None:
+            column = np.fromiter(
+                (r.stats.get(name, default) for r in self._records),
+                dtype=np.float64,
+                count=len(self._records),
+            )
+            self._columns[name] = column
+        return column
+
+    def recent_form_winrate(self) -> np.ndarray:
+        """Per-player winrate over the form window, 0.0 when empty."""
+        games = np.maximum(self.recent_games, 1)
+        return self.recent_form.sum(axis=1) / games